@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""
+Memoized loading of draccus calibration files.
+
+Robots and teleoperators parse their calibration JSON on every construction.
+`draccus.load` is reflection-heavy, so parsed results are cached per file and
+invalidated whenever the file's modification time or size changes.
+"""
+
+from __future__ import annotations
+
+import os
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+_CALIB_CACHE: dict[tuple[str, int, int, Any], Any] = {}
+_DIRS_CREATED: set[str] = set()
+
+
+def ensure_dir(path: str | Path) -> None:
+    """Create `path` (and parents) once per process; later calls for the same path are free."""
+    key = str(path)
+    if key not in _DIRS_CREATED:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _DIRS_CREATED.add(key)
+
+
+def load_calibration(fpath: str | Path, calib_type: Any) -> Any:
+    """
+    Load `fpath` as `calib_type` with draccus, reusing the last parse if the file is unchanged.
+
+    Args:
+        fpath (str | Path): Calibration JSON file.
+        calib_type (Any): Type passed to `draccus.load` (e.g. `dict[str, MotorCalibration]`).
+
+    Returns:
+        Any: A fresh copy of the parsed calibration, safe for the caller to mutate.
+    """
+    path = str(Path(fpath).resolve())
+    stat = Path(path).stat()
+    key = (path, stat.st_mtime_ns, stat.st_size, calib_type)
+    if key not in _CALIB_CACHE:
+        # Imported lazily so importing robots/teleoperators does not pay for draccus.
+        import draccus
+
+        with open(path) as f, draccus.config_type("json"):
+            loaded = draccus.load(calib_type, f)
+        for stale in [k for k in _CALIB_CACHE if k[0] == path and k[3] == calib_type]:
+            del _CALIB_CACHE[stale]
+        _CALIB_CACHE[key] = loaded
+    return deepcopy(_CALIB_CACHE[key])
+
+
+def save_calibration(fpath: str | Path, calibration: Any) -> None:
+    """
+    Atomically write `calibration` to `fpath` as JSON with draccus.
+
+    Args:
+        fpath (str | Path): Calibration JSON file.
+        calibration (Any): Calibration object understood by `draccus.dump`.
+    """
+    import draccus
+
+    path = Path(fpath)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f, draccus.config_type("json"):
+        draccus.dump(calibration, f, indent=2)
+    os.replace(tmp, path)
@@ -473,17 +473,20 @@ class MotorControl:
         header = 0xAA
         tail = 0x55
         frame_length = 16
-        i = 0
         remainder_pos = 0
 
-        while i <= len(data) - frame_length:
-            if data[i] == header and data[i + frame_length - 1] == tail:
+        # bytes.find uses memchr, which scans for the header a word at a time instead of
+        # stepping through every byte in Python.
+        i = data.find(header)
+        while 0 <= i <= len(data) - frame_length:
+            if data[i + frame_length - 1] == tail:
                 frame = data[i:i + frame_length]
                 frames.append(frame)
                 i += frame_length
                 remainder_pos = i
             else:
                 i += 1
+            i = data.find(header, i)
         self.data_save = data[remainder_pos:]
         return frames
 
@@ -7,7 +7,6 @@ from enum import Enum
 from pprint import pformat
 from copy import deepcopy
 from pathlib import Path  # noqa: F401
-import draccus  # noqa: F401
 
 import logging
 import time
@@ -427,16 +426,15 @@ class DamiaoMotorsBus:
         for motor_name, value in positions.items():
             norm_mode = self.motor_norm_mode
             min_, max_ = self._get_calibration_range(motor_name)
+            bounded = min_ if value < min_ else max_ if value > max_ else value
             if norm_mode is MotorNormMode.NONE:
-                normalized[motor_name] = self._clamp(value, min_, max_)
+                normalized[motor_name] = bounded
             elif norm_mode is MotorNormMode.DEGREES:
-                normalized[motor_name] = math.degrees(self._clamp(value, min_, max_))
+                normalized[motor_name] = math.degrees(bounded)
             elif norm_mode is MotorNormMode.CENTERING:
                 center = (min_ + max_) / 2
-                bounded = self._clamp(value, min_, max_)
                 normalized[motor_name] = bounded - center
             else:
-                bounded = self._clamp(value, min_, max_)
                 span = max_ - min_
                 if span == 0:
                     raise ValueError(f"Invalid calibration for motor '{motor_name}': min and max are equal.")
@@ -455,25 +453,27 @@ class DamiaoMotorsBus:
             norm_mode = self.motor_norm_mode
             min_, max_ = self._get_calibration_range(motor_name)
             if norm_mode is MotorNormMode.NONE:
-                unnormalized[motor_name] = self._clamp(value, min_, max_)
+                unnormalized[motor_name] = min_ if value < min_ else max_ if value > max_ else value
                 continue
             if norm_mode is MotorNormMode.DEGREES:
                 radians_val = math.radians(value)
-                unnormalized[motor_name] = self._clamp(radians_val, min_, max_)
+                unnormalized[motor_name] = (
+                    min_ if radians_val < min_ else max_ if radians_val > max_ else radians_val
+                )
                 continue
             span = max_ - min_
             if span == 0:
                 raise ValueError(f"Invalid calibration for motor '{motor_name}': min and max are equal.")
 
             if norm_mode is MotorNormMode.RANGE_M100_100:
-                bounded = self._clamp(value, -100.0, 100.0)
+                bounded = -100.0 if value < -100.0 else 100.0 if value > 100.0 else value
                 unnormalized[motor_name] = ((bounded + 100.0) / 200.0) * span + min_
             elif norm_mode is MotorNormMode.RANGE_0_100:
-                bounded = self._clamp(value, 0.0, 100.0)
+                bounded = 0.0 if value < 0.0 else 100.0 if value > 100.0 else value
                 unnormalized[motor_name] = (bounded / 100.0) * span + min_
             elif norm_mode is MotorNormMode.CENTERING:
                 half_span = span / 2
-                bounded = self._clamp(value, -half_span, half_span)
+                bounded = -half_span if value < -half_span else half_span if value > half_span else value
                 center = (min_ + max_) / 2
                 unnormalized[motor_name] = bounded + center
             else:
@@ -515,10 +515,6 @@ class DamiaoMotorsBus:
         selected_motors = self._select_motors(motors)
         return all(motor_name in self.calibration for motor_name in selected_motors)
 
-    @staticmethod
-    def _clamp(value: float, min_: float, max_: float) -> float:
-        return max(min_, min(max_, value))
-
     def check_offset(self,motors: str | list[str] | None =None) -> bool:
 
         """Check if the selected motors have same offset as cached calibration."""
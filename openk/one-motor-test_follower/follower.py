@@ -20,13 +20,12 @@ from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-import draccus
-
 from lerobot.utils.constants import HF_LEROBOT_CALIBRATION, TELEOPERATORS
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.robots import Robot
 from lerobot.robots.utils import ensure_safe_goal_position
 
+from ..calibration_cache import ensure_dir, load_calibration
 from ..damiao.DM_CAN import DM_Motor_Type, Motor
 from ..damiao.damiao import DamiaoMotorsBus, MotorCalibration
 from .config_follower import OneMotorFollowerConfig
@@ -49,11 +48,13 @@ class OneMotorFollower(Robot):
             if config.calibration_dir is not None
             else HF_LEROBOT_CALIBRATION / TELEOPERATORS / self.name
         )
-        self.calibration_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.calibration_dir)
         self.calibration_fpath = self.calibration_dir / f"{self.id}.json"
         self.calibration: dict[str, MotorCalibration] = {}
-        if self.calibration_fpath.is_file():
+        try:
             self._load_calibration()
+        except FileNotFoundError:
+            pass
 
         self.config = config
         self.bus = DamiaoMotorsBus(
@@ -78,8 +79,7 @@ class OneMotorFollower(Robot):
 
     def _load_calibration(self, fpath: Path | None = None) -> None:
         fpath = self.calibration_fpath if fpath is None else fpath
-        with open(fpath) as f, draccus.config_type("json"):
-            self.calibration = draccus.load(dict[str, MotorCalibration], f)
+        self.calibration = load_calibration(fpath, dict[str, MotorCalibration])
 
     @property
     def is_connected(self) -> bool:
@@ -179,7 +179,8 @@ class OneMotorFollower(Robot):
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
         time_start = time.perf_counter()
-        goal_positions = {key.removesuffix(".pos"): val for key, val in action.items() if key.endswith(".pos")}
+        # The endswith check guarantees the suffix, so a plain slice strips it.
+        goal_positions = {key[:-4]: val for key, val in action.items() if key.endswith(".pos")}
 
         if self.config.max_relative_target is not None:
             present_pos = self.bus.sync_read()
@@ -20,14 +20,14 @@ from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-import draccus
-
 from lerobot.motors import Motor, MotorCalibration
 from lerobot.motors.feetech import FeetechMotorsBus, OperatingMode
 from lerobot.teleoperators import Teleoperator
 from lerobot.utils.constants import HF_LEROBOT_CALIBRATION, TELEOPERATORS
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
+from ..calibration_cache import ensure_dir, load_calibration
+from ..serial_latency import lower_latency
 from .config_leader import OneMotorLeaderConfig
 
 logger = logging.getLogger(__name__)
@@ -49,11 +49,13 @@ class OneMotorLeader(Teleoperator):
             if config.calibration_dir is not None
             else HF_LEROBOT_CALIBRATION / TELEOPERATORS / self.name
         )
-        self.calibration_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.calibration_dir)
         self.calibration_fpath = self.calibration_dir / f"{self.id}.json"
         self.calibration: dict[str, MotorCalibration] = {}
-        if self.calibration_fpath.is_file():
+        try:
             self._load_calibration()
+        except FileNotFoundError:
+            pass
 
         self.bus = FeetechMotorsBus(
             port=self.config.port,
@@ -75,8 +77,7 @@ class OneMotorLeader(Teleoperator):
 
     def _load_calibration(self, fpath: Path | None = None) -> None:
         fpath = self.calibration_fpath if fpath is None else fpath
-        with open(fpath) as f, draccus.config_type("json"):
-            self.calibration = draccus.load(dict[str, MotorCalibration], f)
+        self.calibration = load_calibration(fpath, dict[str, MotorCalibration])
 
     def connect(self, calibrate: bool = True) -> None:
         """
@@ -86,6 +87,7 @@ class OneMotorLeader(Teleoperator):
         if self.is_connected:
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
+        lower_latency(self.config.port)
         self.bus.connect()
         if not self.is_calibrated and calibrate:
             logger.info(
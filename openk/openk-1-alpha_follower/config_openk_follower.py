@@ -18,13 +18,27 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from lerobot.cameras import CameraConfig
-from lerobot.cameras.realsense import RealSenseCameraConfig
 from lerobot.robots import RobotConfig
 from ..damiao.damiao import MotorNormMode
 from ..damiao.DM_CAN import Control_Type
 from ..sts import StsNormMode
 
 
+def _default_cameras() -> dict[str, CameraConfig]:
+    # Imported lazily so importing the config does not load pyrealsense2.
+    from lerobot.cameras.realsense import RealSenseCameraConfig
+
+    return {
+        "cam_1": RealSenseCameraConfig(
+            serial_number_or_name="850312071789",
+            fps=30,
+            width=320,
+            height=240,
+            use_depth=False,
+        )
+    }
+
+
 @RobotConfig.register_subclass("openk-1-alpha_follower")
 @dataclass(kw_only=True)
 class OpenKFollowerConfig(RobotConfig):
@@ -42,17 +56,10 @@ class OpenKFollowerConfig(RobotConfig):
     # Set this to a positive scalar to have the same value for all motors, or a dictionary that maps motor
     # names to the max_relative_target value for that motor.
     max_relative_target: float | dict[str, float] | None = None
+    # Present positions read by `get_observation` younger than this are reused to clip
+    # `max_relative_target` instead of reading the Damiao bus again in `send_action`.
+    max_relative_target_stale_s: float = 0.02
     calibration_dir: Path | None = None
 
     # cameras
-    cameras: dict[str, CameraConfig] = field(
-        default_factory=lambda: {
-            "cam_1": RealSenseCameraConfig(
-                serial_number_or_name="850312071789",
-                fps=30,
-                width=320,
-                height=240,
-                use_depth=False,
-            )
-        }
-    )
+    cameras: dict[str, CameraConfig] = field(default_factory=_default_cameras)
@@ -16,13 +16,12 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-import draccus
-
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.utils.constants import HF_LEROBOT_CALIBRATION, TELEOPERATORS
 
@@ -30,6 +29,8 @@ from ..damiao.DM_CAN import DM_Motor_Type, Motor
 from ..damiao.damiao import DamiaoMotorsBus, MotorCalibration
 from ..sts.motorbus import StsMotorBus, StsMotorCalibration
 from ..sts.STS_CAN import StsMotor
+from ..calibration_cache import ensure_dir, load_calibration, save_calibration
+from ..serial_latency import lower_latency
 
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
@@ -62,13 +63,15 @@ class OpenKFollower(Robot):
             if self.config.calibration_dir is None
             else Path(self.config.calibration_dir)
         )
-        self.calibration_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.calibration_dir)
         self.calibration_fpath = self.calibration_dir / f"{self.id}.json"
         self.calibration: dict[str, MotorCalibration] = {}
         self.sts_calibration: dict[str, StsMotorCalibration] = {}
         self._sts_has_calibration = False
-        if self.calibration_fpath.is_file():
+        try:
             self._load_calibration()
+        except FileNotFoundError:
+            pass
 
         self.config = config
         motor_norm_mode = config.motor_norm_mode
@@ -97,32 +100,45 @@ class OpenKFollower(Robot):
             norm_mode=sts_norm_mode,
         )
         self.cameras = make_cameras_from_configs(config.cameras)
+        # The Damiao read runs on the caller thread; STS and cameras are read concurrently.
+        # Created in connect() and shut down in disconnect().
+        self._io_pool: ThreadPoolExecutor | None = None
+
+        # Motor sets are fixed after construction, so build the per-motor keys once.
+        self._dm_pos_keys = tuple(f"{motor}.pos" for motor in self.bus.motor_names)
+        self._dm_vel_keys = tuple(f"{motor}.vel" for motor in self.bus.motor_names)
+        self._dm_tor_keys = tuple(f"{motor}.tor" for motor in self.bus.motor_names)
+        self._sts_pos_keys = tuple(f"{motor}.pos" for motor in self.sts_bus.motor_names)
+        self._dm_names_set = frozenset(self.bus.motor_names)
+        self._sts_names_set = frozenset(self.sts_bus.motor_names)
+
+        # Latest Damiao positions from get_observation, reused by send_action while fresh.
+        self._last_present_pos: dict[str, Any] | None = None
+        self._last_present_ts = 0.0
 
-    @property
+    @cached_property
     def _motors_ft(self) -> dict[str, type]:
         res = {}
-        res.update({f"{motor}.pos": float for motor in self.bus.motor_names})
-        res.update({f"{motor}.pos": float for motor in self.sts_bus.motor_names})
-        res.update({f"{motor}.vel": float for motor in self.bus.motor_names})
-        res.update({f"{motor}.tor": float for motor in self.bus.motor_names})
+        res.update(dict.fromkeys(self._dm_pos_keys, float))
+        res.update(dict.fromkeys(self._sts_pos_keys, float))
+        res.update(dict.fromkeys(self._dm_vel_keys, float))
+        res.update(dict.fromkeys(self._dm_tor_keys, float))
         return res
 
-    @property
+    @cached_property
     def _cameras_ft(self) -> dict[str, tuple]:
-        return {
-            cam: (self.config.cameras[cam].height, self.config.cameras[cam].width, 3) for cam in self.cameras
-        }
+        return {cam: (cfg.height, cfg.width, 3) for cam, cfg in self.config.cameras.items()}
 
-    @property
+    @cached_property
     def _motors_ft2(self) -> dict[str, type]:
         res = {}
-        res.update({f"{motor}.pos": float for motor in self.bus.motor_names})
-        res.update({f"{motor}.pos": float for motor in self.sts_bus.motor_names})
+        res.update(dict.fromkeys(self._dm_pos_keys, float))
+        res.update(dict.fromkeys(self._sts_pos_keys, float))
         return res
 
     @cached_property
     def observation_features(self) -> dict[str, type | tuple]:
-        return {**self._motors_ft, **self._cameras_ft}
+        return self._motors_ft | self._cameras_ft
 
     @cached_property
     def action_features(self) -> dict[str, type]:
@@ -136,8 +152,7 @@ class OpenKFollower(Robot):
             fpath (Path | None): Optional path to the calibration file. Defaults to `self.calibration_fpath`.
         """
         fpath = self.calibration_fpath if fpath is None else fpath
-        with open(fpath) as f, draccus.config_type("json"):
-            combined = draccus.load(CombinedCalibration, f)
+        combined = load_calibration(fpath, CombinedCalibration)
 
         self.calibration = combined.damiao
         self.sts_calibration = combined.sts
@@ -145,9 +160,7 @@ class OpenKFollower(Robot):
 
     def _save_calibration(self, fpath: Path | None = None) -> None:
         fpath = self.calibration_fpath if fpath is None else fpath
-        combined = CombinedCalibration(damiao=self.calibration, sts=self.sts_calibration)
-        with open(fpath, "w") as f, draccus.config_type("json"):
-            draccus.dump(combined, f, indent=2)
+        save_calibration(fpath, CombinedCalibration(damiao=self.calibration, sts=self.sts_calibration))
 
     @property
     def is_connected(self) -> bool:
@@ -163,6 +176,13 @@ class OpenKFollower(Robot):
         if self.is_connected:
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=1 + len(self.cameras), thread_name_prefix=f"{self.name}_io"
+            )
+
+        lower_latency(self.config.port)
+        lower_latency(self.config.sts_port)
         self.bus.connect()
         self.sts_bus.connect()
 
@@ -270,25 +290,20 @@ class OpenKFollower(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        # Read arm position
-        start = time.perf_counter()
-        motor_state = self.bus.sync_read()
-        obs_dict = motor_state.copy()
-        dt_ms = (time.perf_counter() - start) * 1e3
-        logger.debug(f"{self} read state: {dt_ms:.1f}ms")
-
-        start = time.perf_counter()
-        sts_state = self.sts_bus.sync_read(normalize=self._sts_has_calibration)
-        obs_dict.update(sts_state)
-        dt_ms = (time.perf_counter() - start) * 1e3
-        logger.debug(f"{self} read sts state: {dt_ms:.1f}ms")
-
-        # Capture images from cameras
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
+        # The Damiao bus, STS bus and cameras are independent devices, so overlap their reads.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        start = time.perf_counter() if debug else 0.0
+        sts_future = self._io_pool.submit(self.sts_bus.sync_read, normalize=self._sts_has_calibration)
+        cam_futures = {cam_key: self._io_pool.submit(cam.async_read) for cam_key, cam in self.cameras.items()}
+
+        obs_dict = self.bus.sync_read()
+        self._last_present_pos = {key: obs_dict[key] for key in self._dm_pos_keys}
+        self._last_present_ts = time.perf_counter()
+        obs_dict.update(sts_future.result())
+        for cam_key, future in cam_futures.items():
+            obs_dict[cam_key] = future.result()
+        if debug:
+            logger.debug("%s read state and cameras: %.1fms", self, (time.perf_counter() - start) * 1e3)
 
         return obs_dict
 
@@ -309,36 +324,52 @@ class OpenKFollower(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        time_start = time.perf_counter()
-
-        goal_positions = {key.removesuffix(".pos"): val for key, val in action.items() if key.endswith(".pos")}
-        damiao_goal_positions = {
-            motor: val for motor, val in goal_positions.items() if motor in self.bus.motor_names
-        }
-        sts_goal_positions = {
-            motor: val for motor, val in goal_positions.items() if motor in self.sts_bus.motor_names
-        }
+        debug = logger.isEnabledFor(logging.DEBUG)
+        time_start = time.perf_counter() if debug else 0.0
+
+        # Split `.pos` targets per bus in a single pass over the action.
+        damiao_goal_positions: dict[str, Any] = {}
+        sts_goal_positions: dict[str, Any] = {}
+        for key, val in action.items():
+            if not key.endswith(".pos"):
+                continue
+            motor = key[:-4]
+            if motor in self._dm_names_set:
+                damiao_goal_positions[motor] = val
+            elif motor in self._sts_names_set:
+                sts_goal_positions[motor] = val
 
         # Cap goal position when too far away from present position.
-        # /!\ Slower fps expected due to reading from the follower.
+        # Reuse the positions from the latest observation when fresh; otherwise read the follower
+        # (/!\ slower fps expected in that case).
         if self.config.max_relative_target is not None and damiao_goal_positions:
-            present_pos = self.bus.sync_read()
+            present_pos = self._last_present_pos
+            if (
+                present_pos is None
+                or time.perf_counter() - self._last_present_ts > self.config.max_relative_target_stale_s
+            ):
+                present_pos = self.bus.sync_read()
             goal_present_pos = {
                 motor: (g_pos, present_pos[f"{motor}.pos"]) for motor, g_pos in damiao_goal_positions.items()
             }
             damiao_goal_positions = ensure_safe_goal_position(goal_present_pos, self.config.max_relative_target)
-
-        command = action.copy()
-        for motor, val in damiao_goal_positions.items():
-            command[f"{motor}.pos"] = val
+            # Only clipping needs a new dict; the caller's action is never mutated.
+            command = action | {
+                key: damiao_goal_positions[motor]
+                for motor, key in zip(self.bus.motor_names, self._dm_pos_keys)
+                if motor in damiao_goal_positions
+            }
+        else:
+            # The buses only read the command, so forward the action as-is.
+            command = action
 
         # Send goal position to the arm
         self.bus.sync_write(command)
         if sts_goal_positions:
-            sts_command = {f"{motor}.pos": command[f"{motor}.pos"] for motor in self.sts_bus.motor_names}
+            sts_command = {key: command[key] for key in self._sts_pos_keys}
             self.sts_bus.sync_write(sts_command, normalize=self._sts_has_calibration)
-        dt_ms = (time.perf_counter() - time_start) * 1e3
-        logger.debug(f"{self} sent action: {dt_ms:.1f}ms")
+        if debug:
+            logger.debug("%s sent action: %.1fms", self, (time.perf_counter() - time_start) * 1e3)
         return command
 
     def disconnect(self):
@@ -351,5 +382,8 @@ class OpenKFollower(Robot):
             self.sts_bus.disconnect()
         for cam in self.cameras.values():
             cam.disconnect()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
 
         logger.info(f"{self} disconnected.")
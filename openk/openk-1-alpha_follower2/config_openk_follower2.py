@@ -18,7 +18,6 @@ from pathlib import Path
 from dataclasses import dataclass, field
 
 from lerobot.cameras import CameraConfig
-from lerobot.cameras.realsense import RealSenseCameraConfig
 from lerobot.motors import MotorNormMode as FeetechMotorNormMode
 from lerobot.robots import RobotConfig
 
@@ -41,6 +40,21 @@ class StsMotorSpec:
     model: str = "sts3215"
 
 
+def _default_cameras() -> dict[str, CameraConfig]:
+    # Imported lazily so importing the config does not load pyrealsense2.
+    from lerobot.cameras.realsense import RealSenseCameraConfig
+
+    return {
+        "cam_1": RealSenseCameraConfig(
+            serial_number_or_name="850312071789",
+            fps=30,
+            width=320,
+            height=240,
+            use_depth=False,
+        )
+    }
+
+
 @RobotConfig.register_subclass("openk-1-alpha_follower2")
 @dataclass(kw_only=True)
 class OpenKFollower2Config(RobotConfig):
@@ -109,16 +123,9 @@ class OpenKFollower2Config(RobotConfig):
     # Set this to a positive scalar to have the same value for all motors, or a dictionary that maps motor
     # names to the max_relative_target value for that motor.
     max_relative_target: float | dict[str, float] | None = None
+    # Present positions read by `get_observation` younger than this are reused to clip
+    # `max_relative_target` instead of reading the Damiao bus again in `send_action`.
+    max_relative_target_stale_s: float = 0.02
 
     # cameras
-    cameras: dict[str, CameraConfig] = field(
-        default_factory=lambda: {
-            "cam_1": RealSenseCameraConfig(
-                serial_number_or_name="850312071789",
-                fps=30,
-                width=320,
-                height=240,
-                use_depth=False,
-            )
-        }
-    )
+    cameras: dict[str, CameraConfig] = field(default_factory=_default_cameras)
@@ -15,14 +15,14 @@
 # limitations under the License.
 
 import logging
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-import draccus
-
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.motors import Motor as StsMotor
 from lerobot.motors import MotorCalibration as StsMotorCalibration
@@ -34,6 +34,7 @@ from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnected
 from lerobot.robots import Robot
 from lerobot.robots.utils import ensure_safe_goal_position
 
+from ..calibration_cache import ensure_dir, load_calibration, save_calibration
 from ..damiao.DM_CAN import Control_Type, DM_Motor_Type, Motor as DamiaoMotor
 from ..damiao.damiao import DamiaoMotorsBus, MotorCalibration as DamiaoMotorCalibration
 from ..damiao.damiao import MotorNormMode as DamiaoMotorNormMode
@@ -72,11 +73,14 @@ def _resolve_damiao_motor_type(value: object) -> DM_Motor_Type:
 def _build_damiao_motors(specs: list[DamiaoMotorSpec | dict[str, object]]) -> dict[str, DamiaoMotor]:
     motors: dict[str, DamiaoMotor] = {}
     for spec in specs:
-        name = str(_get_spec_value(spec, "name"))
-        motor_type = _resolve_damiao_motor_type(_get_spec_value(spec, "motor_type"))
-        slave_id = int(_get_spec_value(spec, "slave_id"))
-        master_id = int(_get_spec_value(spec, "master_id"))
-        motors[name] = DamiaoMotor(motor_type, slave_id, master_id)
+        if isinstance(spec, DamiaoMotorSpec):
+            name, motor_type, slave_id, master_id = spec.name, spec.motor_type, spec.slave_id, spec.master_id
+        else:
+            name = _get_spec_value(spec, "name")
+            motor_type = _get_spec_value(spec, "motor_type")
+            slave_id = _get_spec_value(spec, "slave_id")
+            master_id = _get_spec_value(spec, "master_id")
+        motors[str(name)] = DamiaoMotor(_resolve_damiao_motor_type(motor_type), int(slave_id), int(master_id))
     return motors
 
 
@@ -86,10 +90,13 @@ def _build_sts_motors(
 ) -> dict[str, StsMotor]:
     motors: dict[str, StsMotor] = {}
     for spec in specs:
-        name = str(_get_spec_value(spec, "name"))
-        motor_id = int(_get_spec_value(spec, "motor_id"))
-        model = str(_get_spec_value(spec, "model"))
-        motors[name] = StsMotor(motor_id, model, norm_mode)
+        if isinstance(spec, StsMotorSpec):
+            name, motor_id, model = spec.name, spec.motor_id, spec.model
+        else:
+            name = _get_spec_value(spec, "name")
+            motor_id = _get_spec_value(spec, "motor_id")
+            model = _get_spec_value(spec, "model")
+        motors[str(name)] = StsMotor(int(motor_id), str(model), norm_mode)
     return motors
 
 
@@ -110,14 +117,16 @@ class OpenKFollower2(Robot):
             self.calibration_dir = Path(self.config.calibration_root) / ROBOTS / self.name
         else:
             self.calibration_dir = HF_LEROBOT_CALIBRATION / TELEOPERATORS / self.name
-        self.calibration_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.calibration_dir)
         self.calibration_fpath = self.calibration_dir / f"{self.id}.json"
         self.calibration: dict[str, DamiaoMotorCalibration] = {}
         self.sts_calibration: dict[str, StsMotorCalibration] = {}
         self._sts_has_calibration = False
         self._damiao_offset_mismatches: dict[str, tuple[float | None, float | None]] = {}
-        if self.calibration_fpath.is_file():
+        try:
             self._load_calibration()
+        except FileNotFoundError:
+            pass
 
         self.config = config
         motor_norm_mode: DamiaoMotorNormMode = config.motor_norm_mode
@@ -139,33 +148,54 @@ class OpenKFollower2(Robot):
             motors=sts_motors,
             calibration=self.sts_calibration,
         )
+        self._connected = False
+        # The control type is fixed for the bus lifetime; checked per motor in send_action.
+        self._is_mit = control_type == Control_Type.MIT
         self.cameras = make_cameras_from_configs(config.cameras)
+        # The Damiao read runs on the caller thread; STS and cameras are read concurrently.
+        # Created in connect() and shut down in disconnect().
+        self._io_pool: ThreadPoolExecutor | None = None
+
+        # Motor sets are fixed after construction, so build the per-motor keys once. The keys are
+        # interned so lookups against other interned copies short-circuit on identity.
+        self._dm_names = tuple(sys.intern(motor) for motor in self.bus.motor_names)
+        self._sts_names = tuple(sys.intern(motor) for motor in self.sts_bus.motors)
+        self._dm_pos_keys = tuple(sys.intern(f"{motor}.pos") for motor in self._dm_names)
+        self._dm_vel_keys = tuple(sys.intern(f"{motor}.vel") for motor in self._dm_names)
+        self._dm_tor_keys = tuple(sys.intern(f"{motor}.tor") for motor in self._dm_names)
+        self._sts_pos_keys = tuple(sys.intern(f"{motor}.pos") for motor in self._sts_names)
+        # Feetech sync_read returns bare motor names; map them to observation keys.
+        self._sts_pos_key = dict(zip(self._sts_names, self._sts_pos_keys))
+
+        # Latest Damiao positions from get_observation, reused by send_action while fresh.
+        self._last_present_pos: dict[str, Any] | None = None
+        self._last_present_ts = 0.0
+        self._dm_pos_key_set = frozenset(self._dm_pos_keys)
+        self._sts_pos_key_set = frozenset(self._sts_pos_keys)
 
-    @property
+    @cached_property
     def _motors_ft(self) -> dict[str, type]:
         res: dict[str, type] = {}
-        res.update({f"{motor}.pos": float for motor in self.bus.motor_names})
-        res.update({f"{motor}.pos": float for motor in self.sts_bus.motors})
-        res.update({f"{motor}.vel": float for motor in self.bus.motor_names})
-        res.update({f"{motor}.tor": float for motor in self.bus.motor_names})
+        res.update(dict.fromkeys(self._dm_pos_keys, float))
+        res.update(dict.fromkeys(self._sts_pos_keys, float))
+        res.update(dict.fromkeys(self._dm_vel_keys, float))
+        res.update(dict.fromkeys(self._dm_tor_keys, float))
         return res
 
-    @property
+    @cached_property
     def _cameras_ft(self) -> dict[str, tuple]:
-        return {
-            cam: (self.config.cameras[cam].height, self.config.cameras[cam].width, 3) for cam in self.cameras
-        }
+        return {cam: (cfg.height, cfg.width, 3) for cam, cfg in self.config.cameras.items()}
 
-    @property
+    @cached_property
     def _motors_ft2(self) -> dict[str, type]:
         res: dict[str, type] = {}
-        res.update({f"{motor}.pos": float for motor in self.bus.motor_names})
-        res.update({f"{motor}.pos": float for motor in self.sts_bus.motors})
+        res.update(dict.fromkeys(self._dm_pos_keys, float))
+        res.update(dict.fromkeys(self._sts_pos_keys, float))
         return res
 
     @cached_property
     def observation_features(self) -> dict[str, type | tuple]:
-        return {**self._motors_ft, **self._cameras_ft}
+        return self._motors_ft | self._cameras_ft
 
     @cached_property
     def action_features(self) -> dict[str, type]:
@@ -173,9 +203,8 @@ class OpenKFollower2(Robot):
 
     def _load_calibration(self, fpath: Path | None = None) -> None:
         fpath = self.calibration_fpath if fpath is None else fpath
+        combined = load_calibration(fpath, CombinedCalibration)
         logger.info(f"Loading calibration from {fpath}")
-        with open(fpath) as f, draccus.config_type("json"):
-            combined = draccus.load(CombinedCalibration, f)
 
         self.calibration = combined.damiao
         self.sts_calibration = combined.sts
@@ -184,17 +213,13 @@ class OpenKFollower2(Robot):
 
     def _save_calibration(self, fpath: Path | None = None) -> None:
         fpath = self.calibration_fpath if fpath is None else fpath
-        combined = CombinedCalibration(damiao=self.calibration, sts=self.sts_calibration)
-        with open(fpath, "w") as f, draccus.config_type("json"):
-            draccus.dump(combined, f, indent=2)
+        save_calibration(fpath, CombinedCalibration(damiao=self.calibration, sts=self.sts_calibration))
 
     @property
     def is_connected(self) -> bool:
-        return (
-            self.bus.is_connected
-            and self.sts_bus.is_connected
-            and all(cam.is_connected for cam in self.cameras.values())
-        )
+        # Set only once connect() succeeds and cleared in disconnect(), so the per-tick checks in
+        # get_observation/send_action do not poll both buses and every camera.
+        return self._connected
 
     @property
     def is_calibrated(self) -> bool:
@@ -205,6 +230,21 @@ class OpenKFollower2(Robot):
         if self.is_connected:
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
+        try:
+            self._connect(calibrate)
+        except BaseException:
+            # Close whatever was opened so a retry does not reopen busy ports.
+            self._close_devices()
+            raise
+        self._connected = True
+        logger.info(f"{self} connected.")
+
+    def _connect(self, calibrate: bool) -> None:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=1 + len(self.cameras), thread_name_prefix=f"{self.name}_io"
+            )
+
         self.bus.connect()
         logger.info("Damiao connected.")
         self.sts_bus.connect(handshake=False)
@@ -225,7 +265,6 @@ class OpenKFollower2(Robot):
             cam.connect()
 
         self.configure()
-        logger.info(f"{self} connected.")
 
     def calibrate(self) -> None:
         """Interactively record offsets/ranges of motion and persist them."""
@@ -342,23 +381,24 @@ class OpenKFollower2(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        start = time.perf_counter()
-        motor_state = self.bus.sync_read()
-        obs_dict = motor_state.copy()
-        dt_ms = (time.perf_counter() - start) * 1e3
-        logger.debug(f"{self} read Damiao state: {dt_ms:.1f}ms")
-
-        start = time.perf_counter()
-        sts_state = self.sts_bus.sync_read("Present_Position", normalize=self._sts_has_calibration, num_retry=3)
-        obs_dict.update({f"{motor}.pos": val for motor, val in sts_state.items()})
-        dt_ms = (time.perf_counter() - start) * 1e3
-        logger.debug(f"{self} read STS state: {dt_ms:.1f}ms")
-
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
+        # The Damiao bus, STS bus and cameras are independent devices, so overlap their reads.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        start = time.perf_counter() if debug else 0.0
+        sts_future = self._io_pool.submit(
+            self.sts_bus.sync_read, "Present_Position", normalize=self._sts_has_calibration, num_retry=3
+        )
+        cam_futures = {cam_key: self._io_pool.submit(cam.async_read) for cam_key, cam in self.cameras.items()}
+
+        obs_dict = self.bus.sync_read()
+        self._last_present_pos = {key: obs_dict[key] for key in self._dm_pos_keys}
+        self._last_present_ts = time.perf_counter()
+        sts_pos_key = self._sts_pos_key
+        for motor, val in sts_future.result().items():
+            obs_dict[sts_pos_key[motor]] = val
+        for cam_key, future in cam_futures.items():
+            obs_dict[cam_key] = future.result()
+        if debug:
+            logger.debug("%s read state and cameras: %.1fms", self, (time.perf_counter() - start) * 1e3)
 
         return obs_dict
 
@@ -367,45 +407,78 @@ class OpenKFollower2(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        time_start = time.perf_counter()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        time_start = time.perf_counter() if debug else 0.0
 
-        goal_positions = {key.removesuffix(".pos"): val for key, val in action.items() if key.endswith(".pos")}
-        damiao_goal_positions = {
-            motor: val for motor, val in goal_positions.items() if motor in self.bus.motor_names
-        }
-        sts_goal_positions = {
-            motor: val for motor, val in goal_positions.items() if motor in self.sts_bus.motors
-        }
+        # Split `.pos` targets per bus in a single pass over the action.
+        damiao_goal_positions: dict[str, Any] = {}
+        sts_goal_positions: dict[str, Any] = {}
+        for key, val in action.items():
+            if key in self._dm_pos_key_set:
+                damiao_goal_positions[key[:-4]] = val
+            elif key in self._sts_pos_key_set:
+                sts_goal_positions[key[:-4]] = val
 
+        # Reuse the positions from the latest observation when fresh; otherwise read the follower.
         if self.config.max_relative_target is not None and damiao_goal_positions:
-            present_pos = self.bus.sync_read()
+            present_pos = self._last_present_pos
+            if (
+                present_pos is None
+                or time.perf_counter() - self._last_present_ts > self.config.max_relative_target_stale_s
+            ):
+                present_pos = self.bus.sync_read()
             goal_present_pos = {
                 motor: (g_pos, present_pos[f"{motor}.pos"]) for motor, g_pos in damiao_goal_positions.items()
             }
             damiao_goal_positions = ensure_safe_goal_position(goal_present_pos, self.config.max_relative_target)
 
+        # Keep every action key (`.vel`/`.tor` and pass-through entries) and overwrite the clipped
+        # Damiao targets, filling in the MIT velocity default where the action has none.
         command = action.copy()
-        for motor, val in damiao_goal_positions.items():
-            command[f"{motor}.pos"] = val
-            if self.bus.control_type == Control_Type.MIT and f"{motor}.vel" not in command:
-                command[f"{motor}.vel"] = 0.0
+        for motor, pos_key, vel_key in zip(self._dm_names, self._dm_pos_keys, self._dm_vel_keys):
+            if motor in damiao_goal_positions:
+                command[pos_key] = damiao_goal_positions[motor]
+                if self._is_mit and vel_key not in command:
+                    command[vel_key] = 0.0
 
-        self.bus.sync_write(command)
         if sts_goal_positions:
-            self.sts_bus.sync_write("Goal_Position", sts_goal_positions, normalize=self._sts_has_calibration)
-        dt_ms = (time.perf_counter() - time_start) * 1e3
-        logger.debug(f"{self} sent action: {dt_ms:.1f}ms")
+            # The buses are independent, so write STS on the pool while Damiao is written inline.
+            sts_future = self._io_pool.submit(
+                self.sts_bus.sync_write, "Goal_Position", sts_goal_positions, normalize=self._sts_has_calibration
+            )
+            self.bus.sync_write(command)
+            sts_future.result()
+        else:
+            self.bus.sync_write(command)
+        if debug:
+            logger.debug("%s sent action: %.1fms", self, (time.perf_counter() - time_start) * 1e3)
         return command
 
     def disconnect(self):
         """Gracefully disconnect the robot and attached cameras."""
-        if not self.is_connected:
+        if not self._connected and not self._any_device_open():
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        self.bus.disconnect(self.config.disable_torque_on_disconnect)
+        self._close_devices()
+        logger.info(f"{self} disconnected.")
+
+    def _any_device_open(self) -> bool:
+        return (
+            self.bus.is_connected
+            or self.sts_bus.is_connected
+            or any(cam.is_connected for cam in self.cameras.values())
+        )
+
+    def _close_devices(self) -> None:
+        """Close every bus and camera that is actually open, then stop the I/O pool."""
+        self._connected = False
+        if self.bus.is_connected:
+            self.bus.disconnect(self.config.disable_torque_on_disconnect)
         if self.sts_bus.is_connected:
             self.sts_bus.disconnect(self.config.disable_torque_on_disconnect)
         for cam in self.cameras.values():
-            cam.disconnect()
-
-        logger.info(f"{self} disconnected.")
+            if cam.is_connected:
+                cam.disconnect()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
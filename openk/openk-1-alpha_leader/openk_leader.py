@@ -16,14 +16,15 @@
 
 import logging
 import time
+from functools import cached_property
 from typing import Any
 from pathlib import Path
-import draccus
 
 from lerobot.teleoperators import Teleoperator
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.utils.constants import HF_LEROBOT_CALIBRATION, TELEOPERATORS
 
+from ..calibration_cache import ensure_dir, load_calibration
 from ..damiao.DM_CAN import DM_Motor_Type, Motor
 from ..damiao.damiao import DamiaoMotorsBus, MotorCalibration
 from .config_openk_leader import OpenkLeaderConfig
@@ -48,11 +49,13 @@ class OpenkLeader(Teleoperator):
             if self.config.calibration_dir is None
             else Path(self.config.calibration_dir)
         )
-        self.calibration_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.calibration_dir)
         self.calibration_fpath = self.calibration_dir / f"{self.id}.json"
         self.calibration: dict[str, MotorCalibration] = {}
-        if self.calibration_fpath.is_file():
+        try:
             self._load_calibration()
+        except FileNotFoundError:
+            pass
 
         #######################################################
 
@@ -71,7 +74,7 @@ class OpenkLeader(Teleoperator):
             control_type=self.config.control_type,
         )
 
-    @property
+    @cached_property
     def action_features(self) -> dict[str, type]:
         """The leader streams normalized joint positions and velocities for each motor."""
         features = {}
@@ -128,8 +131,7 @@ class OpenkLeader(Teleoperator):
             fpath (Path | None): Optional path to the calibration file. Defaults to `self.calibration_fpath`.
         """
         fpath = self.calibration_fpath if fpath is None else fpath
-        with open(fpath) as f, draccus.config_type("json"):
-            self.calibration = draccus.load(dict[str, MotorCalibration], f)
+        self.calibration = load_calibration(fpath, dict[str, MotorCalibration])
 
 
     def calibrate(self) -> None:
@@ -20,37 +20,28 @@ from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-import draccus
-
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
 from lerobot.motors.feetech import FeetechMotorsBus, OperatingMode
 from lerobot.teleoperators import Teleoperator
 from lerobot.utils.constants import HF_LEROBOT_CALIBRATION, ROBOTS, TELEOPERATORS
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
+from ..calibration_cache import ensure_dir, load_calibration, save_calibration
 from .config_openk_sts_leader import OpenkStsLeaderConfig, StsMotorSpec
 
 logger = logging.getLogger(__name__)
 
 
-def _get_spec_value(spec: object, key: str):
-    if hasattr(spec, key):
-        return getattr(spec, key)
-    if isinstance(spec, dict) and key in spec:
-        return spec[key]
-    raise KeyError(f"Missing '{key}' in motor spec: {spec}")
-
-
 def _build_sts_motors(
     specs: list[StsMotorSpec | dict[str, object]],
     norm_mode: MotorNormMode,
 ) -> dict[str, Motor]:
     motors: dict[str, Motor] = {}
     for spec in specs:
-        name = str(_get_spec_value(spec, "name"))
-        motor_id = int(_get_spec_value(spec, "motor_id"))
-        model = str(_get_spec_value(spec, "model"))
-        motors[name] = Motor(motor_id, model, norm_mode)
+        # Dict specs are coerced once so every spec is then read by plain attribute access.
+        if isinstance(spec, dict):
+            spec = StsMotorSpec(**spec)
+        motors[str(spec.name)] = Motor(int(spec.motor_id), str(spec.model), norm_mode)
     return motors
 
 
@@ -70,11 +61,13 @@ class OpenkStsLeader(Teleoperator):
             self.calibration_dir = Path(self.config.calibration_root) / TELEOPERATORS / self.name
         else:
             self.calibration_dir = HF_LEROBOT_CALIBRATION / TELEOPERATORS / self.name
-        self.calibration_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.calibration_dir)
         self.calibration_fpath = self.calibration_dir / f"{self.id}.json"
         self.calibration: dict[str, MotorCalibration] = {}
-        if self.calibration_fpath.is_file():
+        try:
             self._load_calibration()
+        except FileNotFoundError:
+            pass
 
         motors = _build_sts_motors(self.config.sts_motors, self.config.motor_norm_mode)
         self.bus = FeetechMotorsBus(
@@ -97,13 +90,11 @@ class OpenkStsLeader(Teleoperator):
 
     def _load_calibration(self, fpath: Path | None = None) -> None:
         fpath = self.calibration_fpath if fpath is None else fpath
-        with open(fpath) as f, draccus.config_type("json"):
-            self.calibration = draccus.load(dict[str, MotorCalibration], f)
+        self.calibration = load_calibration(fpath, dict[str, MotorCalibration])
 
     def _save_calibration(self, fpath: Path | None = None) -> None:
         fpath = self.calibration_fpath if fpath is None else fpath
-        with open(fpath, "w") as f, draccus.config_type("json"):
-            draccus.dump(self.calibration, f, indent=2)
+        save_calibration(fpath, self.calibration)
 
     def connect(self, calibrate: bool = True) -> None:
         if self.is_connected:
@@ -1,13 +1,41 @@
+from __future__ import annotations
+
 import logging
+import select
+import struct
 import time
+from array import array
 from dataclasses import dataclass
-from typing import Dict
+from typing import TYPE_CHECKING, Iterable
 
 import numpy as np
-from serial import Serial
+
+if TYPE_CHECKING:
+    from serial import Serial
 
 logger = logging.getLogger(__name__)
 
+SEND_FRAME_LENGTH = 30
+RECV_FRAME_LENGTH = 16
+FRAME_HEADER = 0xAA
+FRAME_TAIL = 0x55
+# STS servo ids are 0..253 (0xFE is broadcast).
+MAX_MOTOR_ID = 253
+NO_POSITION = -1
+# Little-endian CAN id at byte 13 and the 8-byte payload at byte 21 of a send frame.
+# The payload is the big-endian motor id and a 16-bit value, followed by four flag bytes.
+_CAN_ID = struct.Struct("<H")
+_PAYLOAD = struct.Struct(">HHBBBB")
+_FRAME_OFFSETS = np.arange(RECV_FRAME_LENGTH)
+# Send frame template: header, length, command and flags, with zeroed CAN id and payload.
+_TEMPLATE = bytes(
+    [
+        0x55, 0xAA, 0x1E, 0x03, 0x01, 0x00, 0x00, 0x00, 0x0A, 0x00,
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x00,
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    ]
+)
+
 
 @dataclass
 class StsMotor:
@@ -19,111 +47,121 @@ class StsMotor:
 class StsController:
     """Low-level STS CAN protocol handler."""
 
-    send_data_frame = np.array(
-        [
-            0x55,
-            0xAA,
-            0x1E,
-            0x03,
-            0x01,
-            0x00,
-            0x00,
-            0x00,
-            0x0A,
-            0x00,
-            0x00,
-            0x00,
-            0x00,
-            0,
-            0,
-            0,
-            0,
-            0x00,
-            0x08,
-            0x00,
-            0x00,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0x00,
-        ],
-        np.uint8,
-    )
-
     def __init__(self, serial_device: Serial):
         self.serial_ = serial_device
-        self.data_save = bytes()
-        self.positions: Dict[int, int] = {}
+        self.data_save = bytearray()
+        # Latest unread reply per motor id; NO_POSITION marks "not received".
+        self.positions = array("i", [NO_POSITION]) * (MAX_MOTOR_ID + 1)
+        # Writable NumPy view of `positions` for storing a batch of replies at once.
+        self._positions_view = np.frombuffer(self.positions, dtype=np.intc)
+        # Reused single-frame buffer; only the CAN id and payload bytes change per write.
+        self._tx = bytearray(_TEMPLATE)
+        self._tx_buf = bytearray()
 
         if self.serial_.is_open:
             self.serial_.close()
 
     def write_position(self, controller_id: int, motor_id: int, angle: int) -> None:
-        data_buf = np.array([0x00] * 8, np.uint8)
-        data_buf[0] = (motor_id >> 8) & 0xFF
-        data_buf[1] = motor_id & 0xFF
-        data_buf[2] = (angle >> 8) & 0xFF
-        data_buf[3] = angle & 0xFF
-        data_buf[4] = 0
-        data_buf[5] = 0xFF
-        data_buf[6] = 0
-        data_buf[7] = 0
-        self._send_data(controller_id, data_buf)
+        self._send_data(controller_id, _PAYLOAD.pack(motor_id & 0xFFFF, angle & 0xFFFF, 0, 0xFF, 0, 0))
+
+    def write_positions(self, controller_id: int, targets: list[tuple[int, int]]) -> None:
+        """Send goal positions for several motors as one buffer in a single serial write."""
+        size = len(targets) * SEND_FRAME_LENGTH
+        if len(self._tx_buf) != size:
+            self._tx_buf = bytearray(_TEMPLATE * len(targets))
+        for offset, (motor_id, angle) in zip(range(0, size, SEND_FRAME_LENGTH), targets):
+            _CAN_ID.pack_into(self._tx_buf, offset + 13, controller_id & 0xFFFF)
+            _PAYLOAD.pack_into(
+                self._tx_buf, offset + 21, motor_id & 0xFFFF, angle & 0xFFFF, 0, 0xFF, 0, 0
+            )
+        self.serial_.write(self._tx_buf)
 
     def read_position(self, controller_id: int, motor_id: int, timeout: float = 0.1) -> int | None:
-        data_buf = np.array([0x00] * 8, np.uint8)
-        data_buf[0] = (motor_id >> 8) & 0xFF
-        data_buf[1] = motor_id & 0xFF
-        data_buf[4] = 0xFF
-        self._send_data(controller_id, data_buf)
-
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        self.request_position(controller_id, motor_id)
+        return self.drain_positions((motor_id,), timeout).get(motor_id)
+
+    def request_position(self, controller_id: int, motor_id: int) -> None:
+        """Send a position query without waiting for the reply; collect it with `drain_positions`."""
+        # Drop a late reply from an earlier timed-out query so it cannot answer this one.
+        self.positions[motor_id] = NO_POSITION
+        self._send_data(controller_id, _PAYLOAD.pack(motor_id & 0xFFFF, 0, 0xFF, 0, 0, 0))
+
+    def drain_positions(self, motor_ids: Iterable[int], timeout: float = 0.1) -> dict[int, int]:
+        """Receive replies until every id in `motor_ids` has answered or `timeout` elapses."""
+        pending = set(motor_ids)
+        deadline = time.monotonic() + timeout
+        while True:
             self.recv()
-            if motor_id in self.positions:
-                return self.positions.pop(motor_id)
-            time.sleep(0.005)
-        return None
+            if all(self.positions[motor_id] != NO_POSITION for motor_id in pending):
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._wait_readable(remaining)
+        res = {}
+        for motor_id in pending:
+            if self.positions[motor_id] != NO_POSITION:
+                res[motor_id] = self.positions[motor_id]
+                self.positions[motor_id] = NO_POSITION
+        return res
+
+    def _wait_readable(self, timeout: float) -> None:
+        """Block until the port has unread bytes or `timeout` elapses, instead of sleeping a fixed tick."""
+        if timeout <= 0:
+            return
+        try:
+            fd = self.serial_.fileno()
+        except (AttributeError, OSError, ValueError):
+            # No pollable descriptor (e.g. non-POSIX backends): fall back to a short sleep.
+            time.sleep(min(timeout, 0.005))
+            return
+        select.select([fd], [], [], timeout)
 
     def recv(self) -> None:
-        data_recv = b"".join([self.data_save, self.serial_.read_all()])
-        packets = self._extract_packets(data_recv)
-        for packet in packets:
-            data = packet[7:15]
-            CANID = (packet[6] << 24) | (packet[5] << 16) | (packet[4] << 8) | packet[3]
-            CMD = packet[1]
-
-            if CMD == 0x11 and (CANID & 0xFFFF) == 0xFF00:
-                # STS response: data[0:2] is motor ID, data[2:4] is position
-                resp_motor_id = (int(data[0]) << 8) | data[1]
-                q_uint = (np.uint16(data[2]) << 8) | data[3]
-                self.positions[resp_motor_id] = int(q_uint)
-
-    def _send_data(self, motor_id: int, data: np.ndarray) -> None:
-        self.send_data_frame[13] = motor_id & 0xFF
-        self.send_data_frame[14] = (motor_id >> 8) & 0xFF
-        self.send_data_frame[21:29] = data
-        self.serial_.write(bytes(self.send_data_frame.T))
-
-    def _extract_packets(self, data: bytes) -> list[bytes]:
-        frames = []
-        header = 0xAA
-        tail = 0x55
-        frame_length = 16
-        i = 0
+        self.data_save += self.serial_.read_all()
+        frames = self._extract_packets(self.data_save)
+        if not len(frames):
+            return
+        # STS response: CMD 0x11 from CAN id 0x??..FF00 (little-endian at bytes 3-6);
+        # data[0:2] (frame[7:9]) is the motor ID and data[2:4] the position, big-endian.
+        replies = frames[(frames[:, 1] == 0x11) & (frames[:, 3] == 0x00) & (frames[:, 4] == 0xFF)]
+        motor_ids = (replies[:, 7].astype(np.intc) << 8) | replies[:, 8]
+        positions = (replies[:, 9].astype(np.intc) << 8) | replies[:, 10]
+        valid = motor_ids <= MAX_MOTOR_ID
+        # With repeated ids the later frame wins, as in arrival order.
+        self._positions_view[motor_ids[valid]] = positions[valid]
+
+    def _send_data(self, motor_id: int, data: bytes) -> None:
+        _CAN_ID.pack_into(self._tx, 13, motor_id & 0xFFFF)
+        self._tx[21:29] = data
+        self.serial_.write(self._tx)
+
+    def _extract_packets(self, data: bytearray) -> np.ndarray:
+        """
+        Remove complete frames from the front of `data` in place, leaving any partial frame.
+
+        Returns:
+            np.ndarray: The frames as a `(K, RECV_FRAME_LENGTH)` uint8 array.
+        """
+        starts = []
         remainder_pos = 0
-
-        while i <= len(data) - frame_length:
-            if data[i] == header and data[i + frame_length - 1] == tail:
-                frames.append(data[i : i + frame_length])
-                i += frame_length
-                remainder_pos = i
-            else:
-                i += 1
-        self.data_save = data[remainder_pos:]
+        frames = np.empty((0, RECV_FRAME_LENGTH), dtype=np.uint8)
+        if len(data) >= RECV_FRAME_LENGTH:
+            # Find every header/tail pair in one vectorized pass, then keep the leftmost
+            # non-overlapping frames, as the byte-by-byte scan did.
+            buf = np.frombuffer(data, dtype=np.uint8)
+            last = len(buf) - RECV_FRAME_LENGTH + 1
+            candidates = np.flatnonzero(
+                (buf[:last] == FRAME_HEADER) & (buf[RECV_FRAME_LENGTH - 1 :] == FRAME_TAIL)
+            )
+            for i in candidates.tolist():
+                if i >= remainder_pos:
+                    starts.append(i)
+                    remainder_pos = i + RECV_FRAME_LENGTH
+            if starts:
+                # Fancy indexing copies, so the frames outlive the trim below.
+                frames = buf[np.array(starts)[:, None] + _FRAME_OFFSETS]
+            # Release the buffer export so `data` can be resized below.
+            del buf
+        del data[:remainder_pos]
         return frames
@@ -1,5 +1,4 @@
 import logging
-import time
 from dataclasses import dataclass
 from typing import Dict
 
@@ -8,6 +7,10 @@ from serial import Serial
 
 logger = logging.getLogger(__name__)
 
+# Write Position packet: LEN covers INSTR + address + 2 position bytes + checksum.
+_WRITE_POSITION_LEN = 5
+_WRITE_POSITION_SUM_BASE = _WRITE_POSITION_LEN + 0x03 + 0x2A
+
 
 @dataclass
 class StsMotor:
@@ -27,26 +30,18 @@ class StsController:
             # We assume the serial port is already configured correctly by the caller
             pass
 
-    def _calculate_checksum(self, data: list[int]) -> int:
+    def _calculate_checksum(self, data: bytes | bytearray | memoryview) -> int:
         return (~sum(data)) & 0xFF
 
     def write_position(self, controller_id: int, motor_id: int, angle: int) -> None:
         # Standard SCS Protocol Write Position
         
         # Packet: FF FF ID LEN INSTR P1...PN CHECKSUM
-        
-        data_buf = [
-            0x2A,             # Address 42 (Goal Position)
-            angle & 0xFF,     # Position Low
-            (angle >> 8) & 0xFF # Position High
-        ]
-        
-        length = len(data_buf) + 2 # Instruction + Checksum
-        packet = [0xFF, 0xFF, motor_id, length, 0x03] + data_buf
-        checksum = self._calculate_checksum(packet[2:])
-        packet.append(checksum)
-        
-        self.serial_.write(bytes(packet))
+        lo = angle & 0xFF           # Position Low
+        hi = (angle >> 8) & 0xFF    # Position High
+        # LEN, INSTR and the Goal Position address are fixed, so only ID and the angle vary in the sum.
+        checksum = (~(_WRITE_POSITION_SUM_BASE + motor_id + lo + hi)) & 0xFF
+        self.serial_.write(bytes((0xFF, 0xFF, motor_id, _WRITE_POSITION_LEN, 0x03, 0x2A, lo, hi, checksum)))
 
     def read_position(self, controller_id: int, motor_id: int, timeout: float = 0.1) -> int | None:
         # Read Position from Address 56 (Present Position), Length 2
@@ -60,43 +55,48 @@ class StsController:
             else:
                  data = [data & 0xFF, (data >> 8) & 0xFF]
         
-        data_buf = [address] + data
-        length = len(data_buf) + 2
-        packet = [0xFF, 0xFF, motor_id, length, 0x03] + data_buf
-        checksum = self._calculate_checksum(packet[2:])
-        packet.append(checksum)
+        length = len(data) + 3 # Address + Instruction + Checksum
+        packet = bytearray((0xFF, 0xFF, motor_id, length, 0x03, address))
+        packet += bytes(data)
+        packet.append(self._calculate_checksum(packet[2:]))
         
-        self.serial_.write(bytes(packet))
+        self.serial_.write(packet)
 
     def read_register(self, motor_id: int, address: int, length: int, timeout: float = 0.1) -> int | None:
-        # Read Instruction: 0x02
-        data_buf = [address, length]
-        packet_len = len(data_buf) + 2
-        packet = [0xFF, 0xFF, motor_id, packet_len, 0x02] + data_buf
-        checksum = self._calculate_checksum(packet[2:])
-        packet.append(checksum)
-        
         self.serial_.reset_input_buffer()
-        self.serial_.write(bytes(packet))
+        self.serial_.write(self._read_packet(motor_id, address, length))
         
-        start_time = time.time()
         # Response: FF FF ID LEN ERROR P1...PN CHECKSUM
         expected_len = 6 + length # 2(Header)+1(ID)+1(Len)+1(Err)+N(Data)+1(Sum)
-        
-        while time.time() - start_time < timeout:
-             if self.serial_.in_waiting >= expected_len:
-                 data = self.serial_.read(expected_len)
-                 if data[0] == 0xFF and data[1] == 0xFF and data[2] == motor_id:
-                     # Checksum verification
-                     if self._calculate_checksum(list(data[2:-1])) == data[-1]:
-                         if length == 1:
-                             return data[5]
-                         elif length == 2:
-                             return (data[6] << 8) | data[5]
-                         else:
-                             return list(data[5:5+length])
-                 return None
-             time.sleep(0.001)
+
+        self._set_timeout(timeout)
+        data = self.serial_.read(expected_len)
+        if len(data) < expected_len:
+            return None
+        return self._parse_reply(memoryview(data), motor_id, length)
+
+    def _read_packet(self, motor_id: int, address: int, length: int) -> bytearray:
+        # Read Instruction: 0x02
+        packet = bytearray((0xFF, 0xFF, motor_id, 4, 0x02, address, length))
+        packet.append(self._calculate_checksum(packet[2:]))
+        return packet
+
+    def _set_timeout(self, timeout: float) -> None:
+        # Let pyserial block in select() until the full reply or the timeout; changing the
+        # timeout reconfigures the port, so only do it when it differs.
+        if self.serial_.timeout != timeout:
+            self.serial_.timeout = timeout
+
+    def _parse_reply(self, data: memoryview, motor_id: int, length: int) -> int | list[int] | None:
+        if data[0] == 0xFF and data[1] == 0xFF and data[2] == motor_id:
+            # Checksum verification
+            if self._calculate_checksum(data[2:-1]) == data[-1]:
+                if length == 1:
+                    return data[5]
+                elif length == 2:
+                    return (data[6] << 8) | data[5]
+                else:
+                    return list(data[5:5+length])
         return None
 
     def recv(self) -> None:
@@ -1,4 +1,14 @@
 from .STS_CAN import StsController, StsMotor
-from .motorbus import StsMotorBus, StsMotorCalibration, StsNormMode
+from .normalize import StsNormMode
 
 __all__ = ["StsController", "StsMotor", "StsMotorBus", "StsMotorCalibration", "StsNormMode"]
+
+
+def __getattr__(name: str):
+    # The bus needs pyserial and lerobot; import it on first use so the CAN protocol and the
+    # normalization helpers load with NumPy alone.
+    if name in ("StsMotorBus", "StsMotorCalibration"):
+        from . import motorbus
+
+        return getattr(motorbus, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,18 @@
 import json
 import logging
-from copy import deepcopy
 from dataclasses import dataclass
-from enum import Enum
-from functools import cached_property
 from pathlib import Path
 import time
 from typing import Dict, TypeAlias
 
+import numpy as np
 from serial import Serial
 
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.utils.utils import enter_pressed, move_cursor_up
 
 from .STS_CAN import StsController, StsMotor
+from .normalize import StsNormMode, normalize_array, unnormalize_array
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +23,6 @@ NameOrID: TypeAlias = str | int
 Value: TypeAlias = int | float
 
 
-class StsNormMode(str, Enum):
-    NONE = "none"
-    RANGE_0_100 = "range_0_100"
-    RANGE_M100_100 = "range_m100_100"
-
-
 @dataclass
 class StsMotorCalibration:
     id: int
@@ -38,6 +31,14 @@ class StsMotorCalibration:
     range_max: float
 
 
+def _clone_calibration(calibration: dict[str, StsMotorCalibration]) -> dict[str, StsMotorCalibration]:
+    """Copy a calibration dict; cheaper than `deepcopy` for these flat dataclasses."""
+    return {
+        name: StsMotorCalibration(calib.id, calib.offset, calib.range_min, calib.range_max)
+        for name, calib in calibration.items()
+    }
+
+
 class StsMotorBus:
     """CAN bus helper for STS actuators, matching the lerobot motor bus API."""
 
@@ -58,14 +59,16 @@ class StsMotorBus:
         self.calibration: dict[str, StsMotorCalibration] = calibration.copy() if calibration else {}
         self._has_calibration: bool = bool(calibration)
         self.norm_mode = norm_mode
+        self.motor_names: tuple[str, ...] = tuple(motors)
+        self._motor_ids: tuple[int, ...] = tuple(motor.id for motor in motors.values())
+        self._pos_keys: tuple[str, ...] = tuple(f"{name}.pos" for name in self.motor_names)
+        self._motor_index: dict[str, int] = {name: i for i, name in enumerate(self.motor_names)}
+        self._id_to_name: dict[int, str] = {motor.id: name for name, motor in motors.items()}
+        self._refresh_calibration_arrays()
 
         self.serial_device = Serial(port, baudrate)
         self._controller = StsController(self.serial_device)
 
-    @cached_property
-    def motor_names(self) -> list[str]:
-        return list(self.motors.keys())
-
     @property
     def is_connected(self) -> bool:
         return self.serial_device.is_open
@@ -98,19 +101,18 @@ class StsMotorBus:
                 f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
             )
 
-        res: dict[str, Value] = {}
-        for motor_name, motor in selected.items():
-            position = self._controller.read_position(self.controller_id, motor.id)
-            if position is not None:
-                res[f"{motor_name}.pos"] = position
+        # Send every query first, then collect the replies in one receive loop.
+        for motor in selected.values():
+            self._controller.request_position(self.controller_id, motor.id)
+        positions = self._controller.drain_positions(motor.id for motor in selected.values())
+        names = tuple(motor_name for motor_name, motor in selected.items() if motor.id in positions)
+        values = [positions[selected[motor_name].id] for motor_name in names]
 
         if normalize:
             if not self._has_calibration:
                 raise RuntimeError("Cannot normalize STS positions without calibration.")
-            positions = {k.split(".")[0]: v for k, v in res.items()}
-            positions = self.normalize_positions(positions)
-            res = {f"{name}.pos": value for name, value in positions.items()}
-        return res
+            values = self.normalize_array(np.array(values, dtype=np.float64), names).tolist()
+        return {f"{name}.pos": value for name, value in zip(names, values)}
 
     def sync_write(self, action: dict[str, Value], *, normalize: bool = True) -> None:
         if not self.is_connected:
@@ -118,29 +120,29 @@ class StsMotorBus:
                 f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
             )
 
-        targets = {}
-        for motor_name, motor in self.motors.items():
-            targets[motor_name] = action[f"{motor_name}.pos"]
+        targets = [action[key] for key in self._pos_keys]
 
         if normalize:
             if not self._has_calibration:
                 raise RuntimeError("Cannot unnormalize STS positions without calibration.")
-            targets = self.unnormalize_positions(targets)
+            targets = self.unnormalize_array(np.array(targets, dtype=np.float64)).tolist()
 
-        for motor_name, motor in self.motors.items():
-            angle = int(targets[motor_name])
-            self._controller.write_position(self.controller_id, motor.id, angle)
+        self._controller.write_positions(
+            self.controller_id,
+            [(motor_id, int(target)) for motor_id, target in zip(self._motor_ids, targets)],
+        )
 
     def read_calibration(self) -> dict[str, StsMotorCalibration]:
-        return deepcopy(self.calibration)
+        return _clone_calibration(self.calibration)
 
     def write_calibration(self, calibration: dict[str, StsMotorCalibration], cache: bool = True) -> None:
         unknown = set(calibration) - set(self.motors)
         if unknown:
             raise KeyError(f"Unknown motors in calibration: {unknown}")
         if cache:
-            self.calibration = deepcopy(calibration)
+            self.calibration = _clone_calibration(calibration)
             self._has_calibration = True
+            self._refresh_calibration_arrays()
 
     def record_ranges_of_motion(
         self,
@@ -217,51 +219,33 @@ class StsMotorBus:
             data = json.load(f)
         loaded = {name: StsMotorCalibration(**fields) for name, fields in data.items()}
         if cache:
-            self.calibration = deepcopy(loaded)
+            self.calibration = _clone_calibration(loaded)
             self._has_calibration = True
+            self._refresh_calibration_arrays()
         return loaded
 
     def reset_calibration(self) -> None:
         self.calibration = {}
         self._has_calibration = False
+        self._refresh_calibration_arrays()
 
     def normalize_positions(self, positions: dict[str, float]) -> dict[str, float]:
-        normalized = {}
-        for motor_name, value in positions.items():
-            min_, max_, offset = self._get_calibration_range(motor_name)
-            shifted = self._clamp(value - offset, min_, max_)
-            span = max_ - min_
-            if span == 0:
-                raise ValueError(f"Invalid calibration for motor '{motor_name}': min and max are equal.")
-            if self.norm_mode is StsNormMode.NONE:
-                normalized[motor_name] = shifted
-            elif self.norm_mode is StsNormMode.RANGE_M100_100:
-                normalized[motor_name] = ((shifted - min_) / span) * 200.0 - 100.0
-            elif self.norm_mode is StsNormMode.RANGE_0_100:
-                normalized[motor_name] = ((shifted - min_) / span) * 100.0
-            else:
-                raise NotImplementedError(f"Normalization for {self.norm_mode} not implemented.")
-        return normalized
+        names = tuple(positions)
+        values = np.fromiter(positions.values(), dtype=np.float64, count=len(names))
+        return dict(zip(names, self.normalize_array(values, names).tolist()))
 
     def unnormalize_positions(self, positions: dict[str, float]) -> dict[str, float]:
-        unnormalized = {}
-        for motor_name, value in positions.items():
-            min_, max_, offset = self._get_calibration_range(motor_name)
-            span = max_ - min_
-            if span == 0:
-                raise ValueError(f"Invalid calibration for motor '{motor_name}': min and max are equal.")
-            if self.norm_mode is StsNormMode.NONE:
-                shifted = self._clamp(value, min_, max_)
-            elif self.norm_mode is StsNormMode.RANGE_M100_100:
-                bounded = self._clamp(value, -100.0, 100.0)
-                shifted = ((bounded + 100.0) / 200.0) * span + min_
-            elif self.norm_mode is StsNormMode.RANGE_0_100:
-                bounded = self._clamp(value, 0.0, 100.0)
-                shifted = (bounded / 100.0) * span + min_
-            else:
-                raise NotImplementedError(f"Unnormalization for {self.norm_mode} not implemented.")
-            unnormalized[motor_name] = shifted + offset
-        return unnormalized
+        names = tuple(positions)
+        values = np.fromiter(positions.values(), dtype=np.float64, count=len(names))
+        return dict(zip(names, self.unnormalize_array(values, names).tolist()))
+
+    def normalize_array(self, values: np.ndarray, names: tuple[str, ...] | None = None) -> np.ndarray:
+        """Normalize raw positions aligned with `names` (default: `motor_names`)."""
+        return normalize_array(values, *self._calibration_arrays(names), self.norm_mode)
+
+    def unnormalize_array(self, values: np.ndarray, names: tuple[str, ...] | None = None) -> np.ndarray:
+        """Inverse of `normalize_array`, returning raw positions aligned with `names`."""
+        return unnormalize_array(values, *self._calibration_arrays(names), self.norm_mode)
 
     def _select_motors(self, motors: NameOrID | list[NameOrID] | None) -> dict[str, StsMotor]:
         if motors is None:
@@ -269,17 +253,17 @@ class StsMotorBus:
         if isinstance(motors, str) and motors in self.motors:
             return {motors: self.motors[motors]}
         if isinstance(motors, int):
-            for name, motor in self.motors.items():
-                if motor.id == motors:
-                    return {name: motor}
-            raise KeyError(f"Unknown motor id: {motors}")
+            name = self._id_to_name.get(motors)
+            if name is None:
+                raise KeyError(f"Unknown motor id: {motors}")
+            return {name: self.motors[name]}
         if isinstance(motors, list):
             selected: dict[str, StsMotor] = {}
             for entry in motors:
                 if isinstance(entry, str):
                     selected[entry] = self.motors[entry]
                 elif isinstance(entry, int):
-                    match = next((name for name, motor in self.motors.items() if motor.id == entry), None)
+                    match = self._id_to_name.get(entry)
                     if match is None:
                         raise KeyError(f"Unknown motor id: {entry}")
                     selected[match] = self.motors[match]
@@ -288,26 +272,48 @@ class StsMotorBus:
             return selected
         raise KeyError(f"Unknown motor selection: {motors}")
 
-    def _get_calibration_range(self, motor_name: str) -> tuple[float, float, float]:
-        if motor_name not in self.calibration:
-            raise RuntimeError(f"No calibration available for motor '{motor_name}'.")
-        calib = self.calibration[motor_name]
-        min_ = calib.range_min - calib.offset
-        max_ = calib.range_max - calib.offset
-        return min_, max_, calib.offset
-
-    @staticmethod
-    def _clamp(value: float, min_: float, max_: float) -> float:
-        return max(min_, min(max_, value))
+    def _refresh_calibration_arrays(self) -> None:
+        """Rebuild the per-motor calibration arrays (ordered like `motor_names`)."""
+        nan = (float("nan"),) * 3
+        table = np.array(
+            [
+                (c.offset, c.range_min, c.range_max) if (c := self.calibration.get(n)) is not None else nan
+                for n in self.motor_names
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        offset = table[:, 0].copy()
+        self._cal_offset = offset
+        self._cal_min = table[:, 1] - offset
+        self._cal_max = table[:, 2] - offset
+        self._cal_span = self._cal_max - self._cal_min
+        self._cal_missing = np.isnan(offset)
+
+    def _calibration_arrays(
+        self, names: tuple[str, ...] | None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if names is None or names == self.motor_names:
+            idx = slice(None)
+        else:
+            try:
+                idx = [self._motor_index[n] for n in names]
+            except KeyError as e:
+                raise RuntimeError(f"No calibration available for motor '{e.args[0]}'.") from None
+        span = self._cal_span[idx]
+        if self._cal_missing[idx].any() or not span.all():
+            checked = self.motor_names if isinstance(idx, slice) else names
+            for name, missing, s in zip(checked, self._cal_missing[idx], span):
+                if missing:
+                    raise RuntimeError(f"No calibration available for motor '{name}'.")
+                if s == 0:
+                    raise ValueError(f"Invalid calibration for motor '{name}': min and max are equal.")
+        return self._cal_min[idx], self._cal_max[idx], self._cal_offset[idx], span
 
     def _read_positions(self, motors: dict[str, StsMotor]) -> dict[str, float]:
         """Fetch latest position readings for the provided motors."""
         if not motors:
             return {}
-        positions = {}
-        for motor_name, motor in motors.items():
-            pos = self._controller.read_position(self.controller_id, motor.id)
-            if pos is None:
-                continue
-            positions[motor_name] = float(pos)
-        return positions
+        for motor in motors.values():
+            self._controller.request_position(self.controller_id, motor.id)
+        raw = self._controller.drain_positions(motor.id for motor in motors.values())
+        return {motor_name: float(raw[motor.id]) for motor_name, motor in motors.items() if motor.id in raw}
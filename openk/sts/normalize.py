@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from enum import Enum
+
+import numpy as np
+
+
+class StsNormMode(str, Enum):
+    NONE = "none"
+    RANGE_0_100 = "range_0_100"
+    RANGE_M100_100 = "range_m100_100"
+
+
+def normalize_array(
+    values: np.ndarray,
+    min_: np.ndarray,
+    max_: np.ndarray,
+    offset: np.ndarray,
+    span: np.ndarray,
+    norm_mode: StsNormMode,
+) -> np.ndarray:
+    """Map raw positions into `norm_mode` units; `min_`/`max_` are the offset-relative range."""
+    shifted = np.clip(values - offset, min_, max_)
+    if norm_mode is StsNormMode.NONE:
+        return shifted
+    if norm_mode is StsNormMode.RANGE_M100_100:
+        return (shifted - min_) / span * 200.0 - 100.0
+    if norm_mode is StsNormMode.RANGE_0_100:
+        return (shifted - min_) / span * 100.0
+    raise NotImplementedError(f"Normalization for {norm_mode} not implemented.")
+
+
+def unnormalize_array(
+    values: np.ndarray,
+    min_: np.ndarray,
+    max_: np.ndarray,
+    offset: np.ndarray,
+    span: np.ndarray,
+    norm_mode: StsNormMode,
+) -> np.ndarray:
+    """Inverse of `normalize_array`, returning raw positions."""
+    if norm_mode is StsNormMode.NONE:
+        shifted = np.clip(values, min_, max_)
+    elif norm_mode is StsNormMode.RANGE_M100_100:
+        shifted = (np.clip(values, -100.0, 100.0) + 100.0) / 200.0 * span + min_
+    elif norm_mode is StsNormMode.RANGE_0_100:
+        shifted = np.clip(values, 0.0, 100.0) / 100.0 * span + min_
+    else:
+        raise NotImplementedError(f"Unnormalization for {norm_mode} not implemented.")
+    return shifted + offset
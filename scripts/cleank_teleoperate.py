@@ -55,6 +55,8 @@ import logging
 import time
 import sys
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pprint import pformat
 import importlib
@@ -63,8 +65,6 @@ from pathlib import Path
 # Add project root to sys.path to allow importing 'utils' and 'openk'
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-import rerun as rr
-
 from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
 from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
 from lerobot.configs import parser
@@ -85,13 +85,16 @@ from lerobot.teleoperators import (  # noqa: F401
     make_teleoperator_from_config,
 )
 from lerobot.utils.import_utils import register_third_party_plugins
-from lerobot.utils.robot_utils import precise_sleep as busy_wait
 from lerobot.utils.utils import init_logging, move_cursor_up
-from lerobot.utils.visualization_utils import init_rerun, log_rerun_data
-from utils.log_utils import rename_daily_log_file_name
+from utils.log_utils import rename_daily_log_file_name, start_queue_logging
 from utils.motor_state_table import format_motor_state_table
 from utils.direction_map import DirectionMapProcessorStep
-from utils.motion_utils import build_home_action, move_home_and_disable_torque, ramp_action
+from utils.motion_utils import (
+    build_home_action,
+    move_home_and_disable_torque,
+    precise_sleep_hybrid,
+    ramp_action,
+)
 
 def _register_openk():
     # デコレータによる型登録を発火させる
@@ -122,6 +125,8 @@ class TeleoperateConfig:
     display_data: bool = False
     # Display action/observation values in the CLI
     display_cli: bool = False
+    # Update the Rerun/CLI displays every N control frames (2 -> 30 Hz at fps=60)
+    vis_decimation: int = 2
     # Force calibration dialog on connect
     always_calibrate: bool = False
     # Optional log file path for init_logging
@@ -136,6 +141,10 @@ class TeleoperateConfig:
     end_home_ramp_dt_s: float = 0.05
     end_home_settle_s: float = 1.0
 
+    def __post_init__(self):
+        if self.vis_decimation < 1:
+            raise ValueError(f"`vis_decimation` must be >= 1, got {self.vis_decimation}.")
+
 def teleop_loop(
     teleop: Teleoperator,
     robot: Robot,
@@ -147,6 +156,7 @@ def teleop_loop(
     display_cli: bool = False,
     duration: float | None = None,
     *,
+    vis_decimation: int = 1,
     start_ramp_time_s: float = 0.0,
     start_ramp_dt_s: float = 0.05,
 ):
@@ -162,6 +172,7 @@ def teleop_loop(
         display_data: If True, fetches robot observations and displays them in Rerun.
         display_cli: If True, prints action/observation values to the CLI.
         duration: The maximum duration of the teleoperation loop in seconds. If None, the loop runs indefinitely.
+        vis_decimation: Update the Rerun/CLI displays only every `vis_decimation` frames.
         teleop_action_processor: An optional pipeline to process raw actions from the teleoperator.
         robot_action_processor: An optional pipeline to process actions before they are sent to the robot.
         robot_observation_processor: An optional pipeline to process raw observations from the robot.
@@ -170,62 +181,97 @@ def teleop_loop(
     start = time.perf_counter()
 
     ramp_done = False
-    while True:
-        loop_start = time.perf_counter()
-
-        # Get robot observation
-        # Not really needed for now other than for visualization
-        # teleop_action_processor can take None as an observation
-        # given that it is the identity processor as default
-        obs = robot.get_observation()
-
-        # Get teleop action
-        raw_action = teleop.get_action()
-
-        # Process teleop action through pipeline
-        teleop_action = teleop_action_processor((raw_action, obs))
-
-        # Process action for robot through pipeline
-        robot_action_to_send = robot_action_processor((teleop_action, obs))
-
-        if not ramp_done and start_ramp_time_s > 0:
-            ramp_action(
-                robot,
-                obs,
-                robot_action_to_send,
-                duration_s=start_ramp_time_s,
-                dt_s=start_ramp_dt_s,
-            )
-            ramp_done = True
-        else:
-            # Send processed action to robot (robot_action_processor.to_output should return dict[str, Any])
-            _ = robot.send_action(robot_action_to_send)
-
-        if display_data or display_cli:
-            # Process robot observation through pipeline
-            obs_transition = robot_observation_processor(obs)
-
-        if display_data:
-            log_rerun_data(
-                observation=obs_transition,
-                action=teleop_action,
-            )
-
-        if display_cli:
-            table, line_count = format_motor_state_table(
-                robot_action_to_send,
-                obs_transition,
-            )
-            print(table)
-            move_cursor_up(line_count + 2)
-
-        dt_s = time.perf_counter() - loop_start
-        busy_wait(1 / fps - dt_s)
-        loop_s = time.perf_counter() - loop_start
-        print(f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)")
-
-        if duration is not None and time.perf_counter() - start >= duration:
-            return
+    # Observations are only consumed by the displays and the start ramp; the default processors
+    # (and DirectionMapProcessorStep) only touch the action, so headless runs skip the read.
+    fetch_obs = display_data or display_cli
+    if display_data:
+        from lerobot.utils.visualization_utils import log_rerun_data
+    # Loop timings of the last second, summarized once per second instead of printed every iteration.
+    loop_times: deque[float] = deque(maxlen=fps)
+    iteration = 0
+    # The robot is idle between send_action and the next iteration's send, so the next observation
+    # is fetched on a worker during display, pacing and the teleop read. The future is always
+    # collected before sending, so the robot's buses are never used from two threads at once.
+    obs_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="teleop_obs") if fetch_obs else None
+    obs_future = obs_pool.submit(robot.get_observation) if obs_pool is not None else None
+    try:
+        while True:
+            loop_start = time.perf_counter()
+
+            ramping = not ramp_done and start_ramp_time_s > 0
+
+            # Get robot observation
+            # Not really needed for now other than for visualization
+            # teleop_action_processor can take None as an observation
+            # given that it is the identity processor as default
+            if obs_future is not None:
+                obs = obs_future.result()
+            elif ramping:
+                obs = robot.get_observation()
+            else:
+                obs = None
+
+            # Get teleop action
+            raw_action = teleop.get_action()
+
+            # Process teleop action through pipeline
+            teleop_action = teleop_action_processor((raw_action, obs))
+
+            # Process action for robot through pipeline
+            robot_action_to_send = robot_action_processor((teleop_action, obs))
+
+            if ramping:
+                ramp_action(
+                    robot,
+                    obs,
+                    robot_action_to_send,
+                    duration_s=start_ramp_time_s,
+                    dt_s=start_ramp_dt_s,
+                )
+                ramp_done = True
+            else:
+                # Send processed action to robot (robot_action_processor.to_output should return dict[str, Any])
+                _ = robot.send_action(robot_action_to_send)
+
+            if obs_pool is not None:
+                obs_future = obs_pool.submit(robot.get_observation)
+
+            show = fetch_obs and iteration % vis_decimation == 0
+            if show:
+                # Process robot observation through pipeline
+                obs_transition = robot_observation_processor(obs)
+
+            if show and display_data:
+                log_rerun_data(
+                    observation=obs_transition,
+                    action=teleop_action,
+                )
+
+            if show and display_cli:
+                table, line_count = format_motor_state_table(
+                    robot_action_to_send,
+                    obs_transition,
+                )
+                sys.stdout.write(table + "\n")
+                sys.stdout.flush()
+                move_cursor_up(line_count + 2)
+
+            dt_s = time.perf_counter() - loop_start
+            precise_sleep_hybrid(1 / fps - dt_s)
+            loop_times.append(time.perf_counter() - loop_start)
+            iteration += 1
+            if iteration % fps == 0:
+                mean_s = sum(loop_times) / len(loop_times)
+                logging.info(
+                    "loop time: mean %.2fms, max %.2fms (%.0f Hz)", mean_s * 1e3, max(loop_times) * 1e3, 1 / mean_s
+                )
+
+            if duration is not None and time.perf_counter() - start >= duration:
+                return
+    finally:
+        if obs_pool is not None:
+            # Wait for an in-flight read so callers can safely drive or disconnect the robot.
+            obs_pool.shutdown(wait=True)
 
 
 @parser.wrap()
@@ -238,8 +284,14 @@ def teleoperate(cfg: TeleoperateConfig):
 
         Path(cfg.log_file).parent.mkdir(parents=True, exist_ok=True)
     init_logging(log_file=cfg.log_file)
-    logging.info(pformat(asdict(cfg)))
+    # Keep console/file writes off the control loop thread.
+    start_queue_logging()
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(pformat(asdict(cfg)))
     if cfg.display_data:
+        # rerun is only needed for the viewer; keep it out of headless runs.
+        from lerobot.utils.visualization_utils import init_rerun
+
         init_rerun(session_name="teleoperation")
 
     teleop = make_teleoperator_from_config(cfg.teleop)
@@ -259,6 +311,7 @@ def teleoperate(cfg: TeleoperateConfig):
             fps=cfg.fps,
             display_data=cfg.display_data,
             display_cli=cfg.display_cli,
+            vis_decimation=cfg.vis_decimation,
             duration=cfg.teleop_time_s,
             teleop_action_processor=teleop_action_processor,
             robot_action_processor=robot_action_processor,
@@ -271,6 +324,8 @@ def teleoperate(cfg: TeleoperateConfig):
         pass
     finally:
         if cfg.display_data:
+            import rerun as rr
+
             rr.rerun_shutdown()
         teleop.disconnect()
         #logging.info("Teleoperator disconnected.")
@@ -35,6 +35,7 @@ import math
 from pathlib import Path
 
 import numpy as np
+from scipy.special import ndtr, ndtri
 
 from lerobot.configs import parser
 from lerobot.robots import RobotConfig
@@ -42,7 +43,7 @@ from lerobot.utils.constants import HF_LEROBOT_CALIBRATION, TELEOPERATORS
 from lerobot.utils.import_utils import register_third_party_plugins
 from lerobot.utils.utils import init_logging
 
-from utils.scurve_profile import build_time_samples, generate_scurve_profile
+from utils.scurve_profile import build_time_samples, generate_scurve_profile_batch
 
 
 def _register_openk() -> None:
@@ -70,6 +71,7 @@ class SegmentSamplingCheckConfig:
     segment_time_max: float = 3.0
     time_sampling: str = "lognormal_frequency"
     time_log_sigma: float | None = None
+    # Accepted for config compatibility; segment times are no longer rejection-sampled.
     time_sampling_max_tries: int = 200
     dt: float = 1.0 / 30.0
     num_segments: int = 200
@@ -91,15 +93,17 @@ class SegmentSamplingCheckConfig:
     log_file: str | Path | None = "logs/check_segment_sampling.log"
 
 
-def _coerce_array(value: list[float] | float | str | None, n_dof: int, name: str) -> np.ndarray | None:
+def _coerce_array(value: list[float] | np.ndarray | float | str | None, n_dof: int, name: str) -> np.ndarray | None:
     if value is None:
         return None
-    if isinstance(value, str):
-        parts = [p.strip() for p in value.split(",") if p.strip()]
-        value = [float(p) for p in parts]
     if isinstance(value, (int, float)):
         return np.full(n_dof, float(value), dtype=float)
-    arr = np.array(list(value), dtype=float)
+    if isinstance(value, np.ndarray):
+        arr = value.astype(float, copy=False).reshape(-1)
+    elif isinstance(value, str):
+        arr = np.array([float(p) for p in value.split(",") if p.strip()], dtype=float)
+    else:
+        arr = np.array(list(value), dtype=float)
     if arr.size == 1:
         return np.full(n_dof, float(arr[0]), dtype=float)
     if arr.size != n_dof:
@@ -182,17 +186,17 @@ def _compute_centers(joint_names: list[str], limits_raw: dict[str, tuple[float,
     return np.array(centers, dtype=float)
 
 
-def _sample_segment_time(
+def _sample_segment_times(
     rng: np.random.Generator,
     t_min: float,
     t_max: float,
+    n: int,
     *,
     method: str,
     log_sigma: float | None,
-    max_tries: int,
-) -> float:
+) -> np.ndarray:
     if method == "uniform":
-        return float(rng.uniform(t_min, t_max))
+        return rng.uniform(t_min, t_max, size=n)
     if method != "lognormal_frequency":
         raise ValueError(f"Unknown time_sampling method: {method}")
 
@@ -205,17 +209,12 @@ def _sample_segment_time(
         log_sigma = max(1e-6, (log_f_max - log_f_min) / 6.0)
     log_mu = 0.5 * (log_f_min + log_f_max)
 
-    freq = None
-    for _ in range(max_tries):
-        candidate = float(rng.lognormal(log_mu, log_sigma))
-        if f_min <= candidate <= f_max:
-            freq = candidate
-            break
-        freq = candidate
-    if freq is None:
-        freq = float(rng.uniform(f_min, f_max))
-    freq = min(max(freq, f_min), f_max)
-    return 1.0 / freq
+    # Inverse-CDF sampling of the truncated normal in log-frequency: every draw is in range.
+    cdf_low = ndtr((log_f_min - log_mu) / log_sigma)
+    cdf_high = ndtr((log_f_max - log_mu) / log_sigma)
+    u = rng.uniform(cdf_low, cdf_high, size=n)
+    freqs = np.clip(np.exp(log_mu + log_sigma * ndtri(u)), f_min, f_max)
+    return 1.0 / freqs
 
 
 def _maybe_plot_segments(
@@ -223,23 +222,31 @@ def _maybe_plot_segments(
     samples: list[dict[str, np.ndarray]],
 ) -> None:
     try:
+        import matplotlib
+
+        # Files only; skip interactive backend initialization.
+        matplotlib.use("Agg")
         import matplotlib.pyplot as plt
     except ImportError:
         logging.warning("matplotlib is not available; skipping plots.")
         return
 
-    for idx, sample in enumerate(samples):
-        t = sample["t"]
-        q = sample["q"]
-        fig, axes = plt.subplots(q.shape[0], 1, sharex=True, figsize=(7.0, 1.8 * q.shape[0]))
-        if q.shape[0] == 1:
-            axes = [axes]
-        for j, ax in enumerate(axes):
-            ax.plot(t, q[j], linewidth=1.2)
-            ax.set_ylabel(f"q[{j}]")
-        axes[-1].set_xlabel("t [s]")
-        fig.tight_layout()
-        fig.savefig(output_dir / f"segment_{idx:03d}.png")
+    # Every sample has the same joint count, so one figure is reused and only its axes are cleared.
+    n_rows = samples[0]["q"].shape[0]
+    fig, axes = plt.subplots(n_rows, 1, sharex=True, figsize=(7.0, 1.8 * n_rows), squeeze=False)
+    axes = axes[:, 0]
+    try:
+        for idx, sample in enumerate(samples):
+            t = sample["t"]
+            q = sample["q"]
+            for j, ax in enumerate(axes):
+                ax.clear()
+                ax.plot(t, q[j], linewidth=1.2)
+                ax.set_ylabel(f"q[{j}]")
+            axes[-1].set_xlabel("t [s]")
+            fig.tight_layout()
+            fig.savefig(output_dir / f"segment_{idx:03d}.png")
+    finally:
         plt.close(fig)
 
 
@@ -248,7 +255,8 @@ def check_segment_sampling(cfg: SegmentSamplingCheckConfig) -> None:
     if cfg.log_file is not None:
         Path(cfg.log_file).parent.mkdir(parents=True, exist_ok=True)
     init_logging(log_file=cfg.log_file)
-    logging.info("Config: %s", asdict(cfg))
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("Config: %s", asdict(cfg))
 
     if cfg.segment_time_max < cfg.segment_time_min:
         raise ValueError("segment_time_max must be >= segment_time_min.")
@@ -332,52 +340,61 @@ def check_segment_sampling(cfg: SegmentSamplingCheckConfig) -> None:
     reject_dq = 0
     samples_for_plot: list[dict[str, np.ndarray]] = []
 
+    # Targets, velocity limits and segment times for every possible attempt, drawn up front;
+    # attempts consume them in order.
+    max_draws = cfg.num_segments * cfg.max_segment_attempts
+    q_targets = rng.uniform(q_min, q_max, size=(max_draws, n_dof))
+    dq_max_all = rng.uniform(v_min, v_max, size=(max_draws, n_dof))
+    segment_times = _sample_segment_times(
+        rng,
+        cfg.segment_time_min,
+        cfg.segment_time_max,
+        max_draws,
+        method=cfg.time_sampling,
+        log_sigma=cfg.time_log_sigma,
+    )
+    draw_i = 0
+
     for segment_id in range(cfg.num_segments):
         for attempt in range(cfg.max_segment_attempts):
             attempts[segment_id] += 1
 
-            q_target = rng.uniform(q_min, q_max)
-            dq_max_sampled = rng.uniform(v_min, v_max)
-            T_segment = _sample_segment_time(
-                rng,
-                cfg.segment_time_min,
-                cfg.segment_time_max,
-                method=cfg.time_sampling,
-                log_sigma=cfg.time_log_sigma,
-                max_tries=cfg.time_sampling_max_tries,
-            )
+            q_target = q_targets[draw_i]
+            dq_max_sampled = dq_max_all[draw_i]
+            T_segment = float(segment_times[draw_i])
+            draw_i += 1
+            bound = dq_max_sampled + 1e-6
+            # Peak velocity is at least the mean |dq|/T, so this rejects without evaluating profiles.
+            if np.any(np.abs(q_target - q_current) > bound * T_segment):
+                reject_dq += 1
+                continue
             t_samples = build_time_samples(T_segment, cfg.dt)
 
-            q_cmd_list = []
-            feasible = True
-            for i in range(n_dof):
-                result = generate_scurve_profile(
-                    q_current[i],
-                    q_target[i],
-                    T_segment,
-                    cfg.dt,
-                    j_lim[i],
-                    a_lim[i],
-                    t_samples=t_samples,
-                )
-                if result is None:
-                    feasible = False
-                    reject_profile += 1
-                    break
-                _, q_prof, dq_prof, _ = result
-                if np.max(np.abs(dq_prof)) > dq_max_sampled[i] + 1e-6:
-                    feasible = False
-                    reject_dq += 1
-                    break
-                q_cmd_list.append(q_prof)
-
-            if feasible:
-                q_cmds = np.stack(q_cmd_list, axis=0)
-                success[segment_id] = True
-                q_current = q_cmds[:, -1]
-                if len(samples_for_plot) < cfg.num_plot_segments:
-                    samples_for_plot.append({"t": t_samples, "q": q_cmds})
-                break
+            # All joints in one call; an infeasible profile on any joint rejects the attempt
+            # before the velocity check.
+            result = generate_scurve_profile_batch(
+                q_current,
+                q_target,
+                T_segment,
+                cfg.dt,
+                j_lim,
+                a_lim,
+                t_samples=t_samples,
+            )
+            if result is None:
+                reject_profile += 1
+                continue
+            _, q_cmds, dq_prof, _ = result
+            if np.any(dq_prof.max(axis=1) > bound) or np.any(dq_prof.min(axis=1) < -bound):
+                reject_dq += 1
+                continue
+
+            success[segment_id] = True
+            # Copy so the (n_dof, T) profile is only kept alive when it is stored for plotting.
+            q_current = q_cmds[:, -1].copy()
+            if len(samples_for_plot) < cfg.num_plot_segments:
+                samples_for_plot.append({"t": t_samples, "q": q_cmds})
+            break
 
     success_rate = float(np.mean(success))
     avg_attempts = float(np.mean(attempts[success])) if np.any(success) else float("nan")
@@ -386,10 +403,13 @@ def check_segment_sampling(cfg: SegmentSamplingCheckConfig) -> None:
     logging.info("Reject counts: profile=%d dq=%d", reject_profile, reject_dq)
 
     if cfg.save_npz:
+        # `success` is bit-packed; read it back with
+        # `np.unpackbits(stats["success"])[: int(stats["num_segments"])].astype(bool)`.
         np.savez(
             output_dir / "sampling_stats.npz",
-            attempts=attempts,
-            success=success.astype(np.int32),
+            attempts=attempts.astype(np.int32, copy=False),
+            success=np.packbits(success),
+            num_segments=np.int32(cfg.num_segments),
             success_rate=success_rate,
             reject_profile=reject_profile,
             reject_dq=reject_dq,
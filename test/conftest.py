@@ -0,0 +1,37 @@
+"""Shared path setup and serial stand-in for the hardware-free tests."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+class FakeSerial:
+    """Stand-in for `serial.Serial`: serves queued byte chunks from `read_all` and records writes."""
+
+    def __init__(self, *args, chunks=(), **kwargs):
+        self.chunks = list(chunks)
+        self.written: list[bytes] = []
+        self.is_open = False
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def read_all(self) -> bytes:
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def write(self, data) -> None:
+        self.written.append(bytes(data))
+
+
+@pytest.fixture
+def fake_serial() -> type[FakeSerial]:
+    return FakeSerial
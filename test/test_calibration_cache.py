@@ -0,0 +1,85 @@
+"""Checks for the mtime-keyed calibration loader."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import subprocess
+import sys
+from dataclasses import dataclass
+
+import draccus
+
+from openk import calibration_cache
+
+
+@dataclass
+class _Calib:
+    id: int
+    range_min: float
+    range_max: float
+
+
+def _write(path: pathlib.Path, range_max: float, mtime_ns: int) -> None:
+    path.write_text(f'{{"m1": {{"id": 1, "range_min": 0.0, "range_max": {range_max}}}}}')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_calibration_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    fpath = tmp_path / "calib.json"
+    _write(fpath, 1.0, 1_000_000_000)
+
+    calls = []
+    real_load = draccus.load
+    monkeypatch.setattr(draccus, "load", lambda *a, **kw: calls.append(a) or real_load(*a, **kw))
+
+    first = calibration_cache.load_calibration(fpath, dict[str, _Calib])
+    second = calibration_cache.load_calibration(fpath, dict[str, _Calib])
+    assert first == second == {"m1": _Calib(id=1, range_min=0.0, range_max=1.0)}
+    assert first is not second
+    assert len(calls) == 1
+
+    _write(fpath, 2.0, 2_000_000_000)
+    third = calibration_cache.load_calibration(fpath, dict[str, _Calib])
+    assert third["m1"].range_max == 2.0
+    assert len(calls) == 2
+
+
+def test_same_mtime_edit_is_detected_by_size(tmp_path):
+    fpath = tmp_path / "calib.json"
+    _write(fpath, 1.0, 1_000_000_000)
+    assert calibration_cache.load_calibration(fpath, dict[str, _Calib])["m1"].range_max == 1.0
+
+    # An edit within the filesystem's mtime granularity still changes the size.
+    _write(fpath, 10.5, 1_000_000_000)
+    assert calibration_cache.load_calibration(fpath, dict[str, _Calib])["m1"].range_max == 10.5
+
+
+def test_save_calibration_round_trips(tmp_path):
+    fpath = tmp_path / "calib.json"
+    calibration_cache.save_calibration(fpath, {"m1": _Calib(id=1, range_min=0.0, range_max=3.0)})
+    assert [p.name for p in tmp_path.iterdir()] == ["calib.json"]
+    assert calibration_cache.load_calibration(fpath, dict[str, _Calib]) == {
+        "m1": _Calib(id=1, range_min=0.0, range_max=3.0)
+    }
+
+
+def test_import_does_not_load_draccus():
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); "
+        "import openk.calibration_cache; print('draccus' in sys.modules)"
+    )
+    root = pathlib.Path(__file__).resolve().parents[1]
+    out = subprocess.run([sys.executable, "-c", code, str(root)], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_ensure_dir_creates_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(calibration_cache, "_DIRS_CREATED", set())
+    target = tmp_path / "a" / "b"
+    calibration_cache.ensure_dir(target)
+    assert target.is_dir()
+
+    target.rmdir()
+    calibration_cache.ensure_dir(target)
+    assert not target.exists()
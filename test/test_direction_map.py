@@ -0,0 +1,34 @@
+"""Checks for the direction map processor step."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("lerobot")
+
+from utils.direction_map import DirectionMapProcessorStep  # noqa: E402
+
+
+def test_action_flips_mapped_joints_without_touching_the_input():
+    step = DirectionMapProcessorStep({"shoulder_pan": -1.0, "grip": 1.0})
+    action = {"shoulder_pan.pos": 10.0, "shoulder_pan.vel": 2.0, "grip.pos": 30.0, "elbow.pos": 5.0}
+    original = dict(action)
+    result = step.action(action)
+    assert action == original
+    assert result == {"shoulder_pan.pos": -10.0, "shoulder_pan.vel": -2.0, "grip.pos": 30.0, "elbow.pos": 5.0}
+    assert step._flips == (("shoulder_pan.pos", -1.0), ("shoulder_pan.vel", -1.0))
+
+
+def test_action_rebuilds_flips_when_key_set_changes():
+    step = DirectionMapProcessorStep({"shoulder_pan": -1.0, "wrist": -1.0})
+    assert step.action({"shoulder_pan.pos": 1.0}) == {"shoulder_pan.pos": -1.0}
+    flips = step._flips
+
+    # Same key set: the cached flips are reused.
+    assert step.action({"shoulder_pan.pos": 2.0}) == {"shoulder_pan.pos": -2.0}
+    assert step._flips is flips
+
+    # New key set: the flips are rebuilt and cover the added joint.
+    assert step.action({"shoulder_pan.pos": 3.0, "wrist.pos": 4.0}) == {"shoulder_pan.pos": -3.0, "wrist.pos": -4.0}
+    assert step._flips == (("shoulder_pan.pos", -1.0), ("wrist.pos", -1.0))
+    assert step.action({"wrist.pos": 5.0, "grip.pos": 6.0}) == {"wrist.pos": -5.0, "grip.pos": 6.0}
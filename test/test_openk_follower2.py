@@ -0,0 +1,72 @@
+"""Checks for the OpenK follower2 action path with the serial buses stubbed out."""
+
+from __future__ import annotations
+
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("serial")
+pytest.importorskip("lerobot")
+
+from openk.damiao import damiao  # noqa: E402
+from openk.damiao.DM_CAN import Control_Type  # noqa: E402
+
+follower2 = importlib.import_module("openk.openk-1-alpha_follower2.openk_follower2")
+config_module = importlib.import_module("openk.openk-1-alpha_follower2.config_openk_follower2")
+
+
+class _FakeStsBus:
+    """Records Goal_Position writes instead of talking to a Feetech bus."""
+
+    def __init__(self, port, motors, calibration=None):
+        self.motors = motors
+        self.writes: list[tuple[str, dict]] = []
+
+    def sync_write(self, data_name, values, normalize=True) -> None:
+        self.writes.append((data_name, dict(values)))
+
+
+@pytest.fixture
+def robot(monkeypatch, tmp_path, fake_serial):
+    monkeypatch.setattr(damiao, "Serial", fake_serial)
+    monkeypatch.setattr(follower2, "FeetechMotorsBus", _FakeStsBus)
+    config = config_module.OpenKFollower2Config(
+        port="/dev/null",
+        sts_port="/dev/null",
+        calibration_dir=tmp_path,
+        control_type=Control_Type.MIT,
+        cameras={},
+    )
+    robot = follower2.OpenKFollower2(config)
+    robot.damiao_writes = []
+    robot.bus.sync_write = robot.damiao_writes.append
+    robot._io_pool = ThreadPoolExecutor(max_workers=1)
+    robot._connected = True
+    yield robot
+    robot._io_pool.shutdown(wait=True)
+
+
+def test_send_action_returns_every_action_key(robot):
+    action = {
+        "shoulder_pan.pos": 10.0,
+        "shoulder_lift.vel": 1.5,
+        "shoulder_roll.tor": 0.2,
+        "elbow_flex.pos": -5.0,
+        "elbow_flex.tor": 0.3,
+        "wrist_flex.pos": 40.0,
+        "gripper_hint": "open",
+    }
+    command = robot.send_action(action)
+
+    # Nothing is dropped, and the MIT velocity default is filled in only for commanded positions.
+    assert {key: command[key] for key in action} == action
+    assert command["shoulder_pan.vel"] == 0.0
+    assert command["elbow_flex.vel"] == 0.0
+    assert "shoulder_lift.pos" not in command
+    assert set(command) == set(action) | {"shoulder_pan.vel", "elbow_flex.vel"}
+    assert robot.damiao_writes == [command]
+    assert robot.sts_bus.writes == [("Goal_Position", {"wrist_flex": 40.0})]
+    assert command is not action
+    assert "shoulder_pan.vel" not in action
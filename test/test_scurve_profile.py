@@ -1,6 +1,12 @@
 import numpy as np
 
-from utils.scurve_profile import run_scurve_self_test
+from utils import scurve_profile
+from utils.scurve_profile import (
+    generate_scurve_profile,
+    generate_scurve_profile_batch,
+    run_scurve_self_test,
+    scurve_state_at,
+)
 
 
 def test_scurve_profile_limits(tmp_path):
@@ -23,3 +29,35 @@ def test_scurve_profile_npz_contents(tmp_path):
     run_scurve_self_test(save_path=out_path)
     with np.load(out_path) as data:
         assert "t" in data and "q" in data and "dq" in data
+
+
+def test_scurve_profile_async_save(tmp_path, monkeypatch):
+    monkeypatch.setattr(scurve_profile, "_SAVE_POOL", None)
+    out_path = tmp_path / "scurve_async.npz"
+    run_scurve_self_test(save_path=out_path, save_async=True)
+    scurve_profile._SAVE_POOL.shutdown(wait=True)
+    with np.load(out_path) as data:
+        assert data["q"].shape == data["t"].shape
+
+
+def test_scurve_profile_batch_matches_per_joint():
+    q0 = np.array([0.0, 1.0, -0.5, 0.3])
+    q1 = np.array([1.2, -0.4, -0.5, 0.9])
+    j_lim = np.array([10.0, 8.0, 10.0, 20.0])
+    a_lim = np.array([2.0, 3.0, 2.0, 4.0])
+    t, q, dq, params = generate_scurve_profile_batch(q0, q1, 2.0, 0.01, j_lim, a_lim)
+    assert q.shape == dq.shape == (4, t.size)
+    for i in range(4):
+        _, q_i, dq_i, _ = generate_scurve_profile(q0[i], q1[i], 2.0, 0.01, j_lim[i], a_lim[i], t_samples=t)
+        np.testing.assert_allclose(q[i], q_i, atol=1e-12)
+        np.testing.assert_allclose(dq[i], dq_i, atol=1e-12)
+
+
+def test_scurve_profile_matches_scalar_state():
+    t_samples = np.concatenate([[-0.1], np.linspace(0.0, 1.5, 301), [1.6]])
+    for q0, q1, j_lim, a_lim in [(0.0, 0.8, 10.0, 2.0), (1.0, -0.3, 40.0, 3.0), (0.2, 0.25, 5.0, 5.0)]:
+        _, q, dq, params = generate_scurve_profile(q0, q1, 1.5, 0.01, j_lim, a_lim, t_samples=t_samples)
+        sign = 1.0 if q1 >= q0 else -1.0
+        expected = np.array([scurve_state_at(float(t), params) for t in t_samples])
+        np.testing.assert_allclose(q, q0 + sign * expected[:, 0], atol=1e-12)
+        np.testing.assert_allclose(dq, sign * expected[:, 1], atol=1e-12)
@@ -0,0 +1,34 @@
+"""Checks for the USB-serial latency timer helper using a fake sysfs tree."""
+
+from __future__ import annotations
+
+import pytest
+
+from openk import serial_latency
+
+
+@pytest.fixture
+def fake_sysfs(tmp_path, monkeypatch):
+    monkeypatch.setattr(serial_latency.sys, "platform", "linux")
+    monkeypatch.setattr(serial_latency, "SYSFS_USB_SERIAL_DIR", tmp_path)
+    device_dir = tmp_path / "ttyUSB0"
+    device_dir.mkdir()
+    latency_file = device_dir / "latency_timer"
+    latency_file.write_text("16\n")
+    return latency_file
+
+
+def test_lower_latency_writes_sysfs(fake_sysfs):
+    assert serial_latency.lower_latency("/dev/ttyUSB0") == 1
+    assert fake_sysfs.read_text().strip() == "1"
+
+
+def test_lower_latency_keeps_already_low_value(fake_sysfs):
+    fake_sysfs.write_text("1\n")
+    assert serial_latency.lower_latency("/dev/ttyUSB0") == 1
+
+
+def test_lower_latency_missing_device_does_not_raise(tmp_path, monkeypatch):
+    monkeypatch.setattr(serial_latency.sys, "platform", "linux")
+    monkeypatch.setattr(serial_latency, "SYSFS_USB_SERIAL_DIR", tmp_path)
+    assert serial_latency.lower_latency(str(tmp_path / "ttyUSB9")) is None
@@ -0,0 +1,69 @@
+"""Checks for the STS CAN bridge receive path using a fake serial device."""
+
+from __future__ import annotations
+
+from openk.sts.STS_CAN import NO_POSITION, StsController
+
+
+def _reply(motor_id: int, position: int, cmd: int = 0x11) -> bytes:
+    frame = bytearray(16)
+    frame[0] = 0xAA
+    frame[1] = cmd
+    frame[3:5] = b"\x00\xff"
+    frame[7:9] = motor_id.to_bytes(2, "big")
+    frame[9:11] = position.to_bytes(2, "big")
+    frame[15] = 0x55
+    return bytes(frame)
+
+
+def test_recv_joins_frames_split_across_reads(fake_serial):
+    frame = _reply(1, 1000)
+    controller = StsController(fake_serial(chunks=[frame[:5], frame[5:12], frame[12:]]))
+    controller.recv()
+    controller.recv()
+    assert controller.positions[1] == NO_POSITION
+    controller.recv()
+    assert controller.positions[1] == 1000
+    assert controller.data_save == b""
+
+
+def test_recv_skips_garbage_between_frames(fake_serial):
+    stream = b"\x01\xaa\x55" + _reply(2, 2048) + b"\x00\xaa" + _reply(3, 7) + b"\x55"
+    controller = StsController(fake_serial(chunks=[stream]))
+    controller.recv()
+    assert controller.positions[2] == 2048
+    assert controller.positions[3] == 7
+
+
+def test_recv_keeps_trailing_partial_frame(fake_serial):
+    tail = _reply(5, 20)
+    controller = StsController(fake_serial(chunks=[_reply(4, 10) + tail[:9], tail[9:]]))
+    controller.recv()
+    assert controller.positions[4] == 10
+    assert controller.positions[5] == NO_POSITION
+    assert controller.data_save == tail[:9]
+    controller.recv()
+    assert controller.positions[5] == 20
+
+
+def test_recv_ignores_unknown_ids_and_other_commands(fake_serial):
+    stream = _reply(300, 99) + _reply(6, 55, cmd=0x12) + _reply(7, 70)
+    controller = StsController(fake_serial(chunks=[stream]))
+    controller.recv()
+    assert controller.positions[6] == NO_POSITION
+    assert controller.positions[7] == 70
+    assert list(controller.positions).count(NO_POSITION) == len(controller.positions) - 1
+
+
+def test_drain_positions_returns_partial_replies_on_timeout(fake_serial):
+    serial = fake_serial()
+    controller = StsController(serial)
+    controller.positions[2] = 1234  # stale reply from an earlier query
+    for motor_id in (1, 2, 3):
+        controller.request_position(0xFF00, motor_id)
+    assert controller.positions[2] == NO_POSITION
+    assert len(serial.written) == 3
+
+    serial.chunks = [_reply(1, 11), _reply(3, 33)]
+    assert controller.drain_positions((1, 2, 3), timeout=0.02) == {1: 11, 3: 33}
+    assert controller.positions[1] == controller.positions[3] == NO_POSITION
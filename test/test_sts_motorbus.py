@@ -0,0 +1,66 @@
+"""Checks for StsMotorBus position normalization using a fake serial device."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("serial")
+pytest.importorskip("lerobot")
+
+from openk.sts import motorbus  # noqa: E402
+from openk.sts.STS_CAN import StsMotor  # noqa: E402
+from openk.sts.motorbus import StsMotorBus, StsMotorCalibration, StsNormMode  # noqa: E402
+
+
+CALIBRATION = {
+    "grip": StsMotorCalibration(id=1, offset=100.0, range_min=600.0, range_max=3600.0),
+    "wrist_flex": StsMotorCalibration(id=2, offset=-50.0, range_min=0.0, range_max=4095.0),
+}
+
+
+def _bus(monkeypatch, fake_serial, norm_mode, calibration=CALIBRATION) -> StsMotorBus:
+    monkeypatch.setattr(motorbus, "Serial", fake_serial)
+    return StsMotorBus(
+        "/dev/null",
+        {"grip": StsMotor(1), "wrist_flex": StsMotor(2)},
+        calibration=calibration,
+        norm_mode=norm_mode,
+    )
+
+
+@pytest.mark.parametrize(
+    ("norm_mode", "expected_mid"),
+    [(StsNormMode.NONE, 2000.0), (StsNormMode.RANGE_0_100, 50.0), (StsNormMode.RANGE_M100_100, 0.0)],
+)
+def test_normalize_round_trip(monkeypatch, fake_serial, norm_mode, expected_mid):
+    bus = _bus(monkeypatch, fake_serial, norm_mode)
+    raw = np.array([2100.0, 100.0])
+    normalized = bus.normalize_array(raw)
+    assert normalized[0] == pytest.approx(expected_mid)
+    np.testing.assert_allclose(bus.unnormalize_array(normalized), raw)
+
+    # Dict API with a reordered subset goes through the per-name index path.
+    positions = {"wrist_flex": 3000.0, "grip": 700.0}
+    restored = bus.unnormalize_positions(bus.normalize_positions(positions))
+    assert list(restored) == list(positions)
+    np.testing.assert_allclose(list(restored.values()), list(positions.values()))
+
+
+def test_normalize_requires_calibration_for_every_motor(monkeypatch, fake_serial):
+    bus = _bus(monkeypatch, fake_serial, StsNormMode.RANGE_M100_100, {"grip": CALIBRATION["grip"]})
+    assert bus.normalize_positions({"grip": 2100.0}) == {"grip": pytest.approx(0.0)}
+    with pytest.raises(RuntimeError, match="wrist_flex"):
+        bus.normalize_array(np.array([2100.0, 100.0]))
+    with pytest.raises(RuntimeError, match="wrist_flex"):
+        bus.unnormalize_positions({"wrist_flex": 0.0})
+
+
+def test_normalize_rejects_empty_range(monkeypatch, fake_serial):
+    calibration = dict(CALIBRATION)
+    calibration["wrist_flex"] = StsMotorCalibration(id=2, offset=0.0, range_min=1000.0, range_max=1000.0)
+    bus = _bus(monkeypatch, fake_serial, StsNormMode.RANGE_0_100, calibration)
+    with pytest.raises(ValueError, match="wrist_flex"):
+        bus.normalize_array(np.array([2100.0, 1000.0]))
+    with pytest.raises(ValueError, match="wrist_flex"):
+        bus.unnormalize_positions({"wrist_flex": 50.0})
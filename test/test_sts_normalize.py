@@ -0,0 +1,44 @@
+"""Checks for the STS position normalization helpers; these need NumPy only."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from openk.sts.normalize import StsNormMode, normalize_array, unnormalize_array
+
+# Two motors with offsets 100 and -50; ranges are offset-relative, as StsMotorBus stores them.
+OFFSET = np.array([100.0, -50.0])
+MIN = np.array([600.0, 0.0]) - OFFSET
+MAX = np.array([3600.0, 4095.0]) - OFFSET
+SPAN = MAX - MIN
+
+
+@pytest.mark.parametrize(
+    ("norm_mode", "expected"),
+    [
+        (StsNormMode.NONE, [2000.0, 150.0]),
+        (StsNormMode.RANGE_0_100, [50.0, 100.0 / 4095.0 * 100.0]),
+        (StsNormMode.RANGE_M100_100, [0.0, 100.0 / 4095.0 * 200.0 - 100.0]),
+    ],
+)
+def test_normalize_round_trip(norm_mode, expected):
+    raw = np.array([2100.0, 100.0])
+    normalized = normalize_array(raw, MIN, MAX, OFFSET, SPAN, norm_mode)
+    np.testing.assert_allclose(normalized, expected)
+    np.testing.assert_allclose(unnormalize_array(normalized, MIN, MAX, OFFSET, SPAN, norm_mode), raw)
+
+
+def test_normalize_clips_to_the_calibrated_range():
+    raw = np.array([0.0, 10_000.0])
+    np.testing.assert_allclose(
+        normalize_array(raw, MIN, MAX, OFFSET, SPAN, StsNormMode.RANGE_M100_100), [-100.0, 100.0]
+    )
+    np.testing.assert_allclose(
+        unnormalize_array(np.array([-150.0, 150.0]), MIN, MAX, OFFSET, SPAN, StsNormMode.RANGE_M100_100),
+        [600.0, 4095.0],
+    )
+    np.testing.assert_allclose(
+        unnormalize_array(np.array([120.0, -5.0]), MIN, MAX, OFFSET, SPAN, StsNormMode.RANGE_0_100),
+        [3600.0, 0.0],
+    )
@@ -16,12 +16,24 @@ class DirectionMapProcessorStep(RobotActionProcessorStep):
 
     def __init__(self, direction_map: Mapping[str, float] | None = None):
         self.direction_map = dict(direction_map or {})
+        # (key, sign) pairs to flip for the last seen action key set; the teleop key set is fixed,
+        # so this is resolved once and each tick only touches the flipped joints.
+        self._flip_keys: frozenset[str] = frozenset()
+        self._flips: tuple[tuple[str, float], ...] = ()
 
     def action(self, action: RobotAction) -> RobotAction:
-        return {
-            key: (val * self.direction_map.get(key.split(".")[0], 1.0))
-            for key, val in action.items()
-        }
+        if action.keys() != self._flip_keys:
+            self._flip_keys = frozenset(action)
+            self._flips = tuple(
+                (key, sign)
+                for key in action
+                if (sign := self.direction_map.get(key.partition(".")[0], 1.0)) != 1.0
+            )
+        # Flip a copy: the caller still logs the unmapped teleop action it passed in.
+        mapped = dict(action)
+        for key, sign in self._flips:
+            mapped[key] = mapped[key] * sign
+        return mapped
 
     def get_config(self) -> dict[str, Mapping[str, float]]:
         return {"direction_map": self.direction_map}
@@ -40,6 +52,6 @@ def apply_direction_map(action: Mapping[str, float], direction_map: Mapping[str,
         return dict(action)
 
     return {
-        key: (val * direction_map.get(key.split(".")[0], 1.0))
+        key: (val * direction_map.get(key.partition(".")[0], 1.0))
         for key, val in action.items()
     }
@@ -1,9 +1,43 @@
+import atexit
+import logging
+import queue
 import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
+# Date stamp for daily log names, refreshed at most once per _DATE_TTL_S.
+_DATE_TTL_S = 60.0
+_date_cache: tuple[float, str] = (float("-inf"), "")
+
+
+def _date_str() -> str:
+    global _date_cache
+    now = time.monotonic()
+    if now - _date_cache[0] > _DATE_TTL_S:
+        _date_cache = (now, time.strftime("%Y%m%d"))
+    return _date_cache[1]
+
+
 def rename_daily_log_file_name(log_file: str | Path) -> Path:
-    log_file_stem = Path(log_file).stem
-    log_file_suffix = Path(log_file).suffix
-    date_str = time.strftime("%Y%m%d")
-    return Path(log_file).with_name(f"{log_file_stem}_{date_str}{log_file_suffix}")
+    path = Path(log_file)
+    return path.with_name(f"{path.stem}_{_date_str()}{path.suffix}")
+
+
+def start_queue_logging() -> QueueListener:
+    """
+    Move the root logger's handlers (as set up by `init_logging`) behind a queue.
+
+    Logging calls then only enqueue the record; console and file writes happen on the
+    listener thread, which is flushed and stopped at interpreter exit.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
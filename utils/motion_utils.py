@@ -5,20 +5,19 @@ import time
 from numbers import Number
 from typing import Any
 
+import numpy as np
+
 
 def _extract_pos_values(data: dict[str, Any]) -> dict[str, float]:
-    pos = {}
-    for key, value in data.items():
-        if not key.endswith(".pos"):
-            continue
-        if not isinstance(value, Number) or isinstance(value, bool):
-            continue
-        pos[key] = float(value)
-    return pos
+    return {
+        key: float(value)
+        for key, value in data.items()
+        if key.endswith(".pos") and type(value) is not bool and isinstance(value, Number)
+    }
 
 
 def build_home_action(action_features: dict[str, type], home_value: float = 0.0) -> dict[str, float]:
-    return {key: home_value for key in action_features if key.endswith(".pos")}
+    return dict.fromkeys((key for key in action_features if key.endswith(".pos")), home_value)
 
 
 def ramp_action(
@@ -39,13 +38,16 @@ def ramp_action(
         return
 
     steps = max(1, int(duration_s / dt_s))
-    for i in range(1, steps + 1):
-        alpha = i / steps
-        action = {}
-        for key, target_val in target_pos.items():
-            start_val = start_pos.get(key, target_val)
-            action[key] = (1.0 - alpha) * start_val + alpha * target_val
-        robot.send_action(action)
+    keys = tuple(target_pos)
+    target = np.fromiter(target_pos.values(), dtype=np.float64, count=len(keys))
+    start = np.fromiter(
+        (start_pos.get(key, target_pos[key]) for key in keys), dtype=np.float64, count=len(keys)
+    )
+    # (steps, n_joints) blend from start to target, built once before the timed loop.
+    alphas = np.arange(1, steps + 1, dtype=np.float64)[:, None] / steps
+    ramp = (1.0 - alphas) * start + alphas * target
+    for row in ramp.tolist():
+        robot.send_action(dict(zip(keys, row)))
         time.sleep(dt_s)
 
 
@@ -85,3 +87,15 @@ def move_home_and_disable_torque(
             disable()
         except Exception:
             logging.exception("Failed to disable torque on %s.", attr)
+
+
+def precise_sleep_hybrid(seconds: float, slack_s: float = 1.5e-3) -> None:
+    """Sleep until `seconds` from now, yielding the CPU except for the final `slack_s` spin."""
+    if seconds <= 0:
+        return
+    deadline = time.perf_counter() + seconds
+    coarse = seconds - slack_s
+    if coarse > 0:
+        time.sleep(coarse)
+    while time.perf_counter() < deadline:
+        pass
@@ -19,10 +19,14 @@ Missing values are rendered as "-".
 
 from __future__ import annotations
 
+from functools import lru_cache
 from numbers import Number
 from typing import Any
 
+import numpy as np
+
 _STATE_SUFFIXES = ("pos", "vel", "tor")
+_SUFFIX_IDX = {suffix: idx for idx, suffix in enumerate(_STATE_SUFFIXES)}
 
 
 def format_motor_state_table(
@@ -42,52 +46,57 @@ def format_motor_state_table(
     Returns:
         (table_text, line_count)
     """
-    act_state, act_order = _extract_state(action)
-    obs_state, obs_order = _extract_state(observation)
+    # Row per motor in first-seen order (action first), column per state suffix; NaN marks missing.
+    motor_rows: dict[str, int] = {}
+    act_entries = _extract_state(action, motor_rows)
+    obs_entries = _extract_state(observation, motor_rows)
 
-    motors = _merge_order(act_order, obs_order)
+    motors = list(motor_rows)
     if not motors:
         return "NO MOTOR DATA", 1
 
-    has_act_vel = any("vel" in act_state.get(motor, {}) for motor in motors)
+    act_state = _state_matrix(act_entries, len(motors))
+    obs_state = _state_matrix(obs_entries, len(motors))
+    pos, vel, tor = (_SUFFIX_IDX[suffix] for suffix in _STATE_SUFFIXES)
 
-    columns: list[tuple[str, dict[str, dict[str, float]], str]] = [
-        ("act.Pos", act_state, "pos"),
-        ("obs.Pos", obs_state, "pos"),
+    columns: list[tuple[str, np.ndarray]] = [
+        ("act.Pos", act_state[:, pos]),
+        ("obs.Pos", obs_state[:, pos]),
     ]
-    if has_act_vel:
-        columns.append(("act.Vel", act_state, "vel"))
-    columns.append(("obs.Vel", obs_state, "vel"))
-    columns.append(("obs.Tor", obs_state, "tor"))
+    if not np.isnan(act_state[:, vel]).all():
+        columns.append(("act.Vel", act_state[:, vel]))
+    columns.append(("obs.Vel", obs_state[:, vel]))
+    columns.append(("obs.Tor", obs_state[:, tor]))
 
     name_header = "MOTOR"
     name_width = max(len(name_header), *(len(motor) for motor in motors))
 
-    cell_values = _build_cells(motors, columns, precision)
+    value_format = f"%.{precision}f"
+    cell_columns = [_format_column(values, value_format) for _, values in columns]
     col_widths = [
-        max(len(header), *(len(row[idx]) for row in cell_values))
-        for idx, (header, _, _) in enumerate(columns)
+        max(len(header), *(len(cell) for cell in cells))
+        for (header, _), cells in zip(columns, cell_columns)
     ]
 
-    header_cells = [name_header.ljust(name_width)]
-    for (header, _, _), width in zip(columns, col_widths):
-        header_cells.append(header.rjust(width))
-    header_line = " | ".join(header_cells)
+    row_format = _row_format(name_width, tuple(col_widths))
+    header_line = row_format.format(name_header, *(header for header, _ in columns))
     separator_line = "-" * len(header_line)
 
     lines = [separator_line, header_line]
-    for motor, row in zip(motors, cell_values):
-        row_cells = [motor.ljust(name_width)]
-        for value, width in zip(row, col_widths):
-            row_cells.append(value.rjust(width))
-        lines.append(" | ".join(row_cells))
+    for motor, row in zip(motors, zip(*cell_columns)):
+        lines.append(row_format.format(motor, *row))
 
     return "\n".join(lines), len(lines)
 
 
-def _extract_state(data: dict[str, Any]) -> tuple[dict[str, dict[str, float]], list[str]]:
-    state: dict[str, dict[str, float]] = {}
-    order: list[str] = []
+@lru_cache(maxsize=8)
+def _row_format(name_width: int, col_widths: tuple[int, ...]) -> str:
+    # One format string per table layout; the layout rarely changes between frames.
+    return " | ".join([f"{{:<{name_width}}}", *(f"{{:>{width}}}" for width in col_widths)])
+
+
+def _extract_state(data: dict[str, Any], motor_rows: dict[str, int]) -> list[tuple[int, int, float]]:
+    entries: list[tuple[int, int, float]] = []
 
     for key, value in data.items():
         if not isinstance(value, Number) or isinstance(value, bool):
@@ -95,47 +104,27 @@ def _extract_state(data: dict[str, Any]) -> tuple[dict[str, dict[str, float]], l
         motor, suffix = _split_motor_key(key)
         if motor is None:
             continue
-        if motor not in state:
-            state[motor] = {}
-            order.append(motor)
-        state[motor][suffix] = float(value)
+        row = motor_rows.setdefault(motor, len(motor_rows))
+        entries.append((row, _SUFFIX_IDX[suffix], float(value)))
 
-    return state, order
+    return entries
+
+
+def _state_matrix(entries: list[tuple[int, int, float]], n_motors: int) -> np.ndarray:
+    state = np.full((n_motors, len(_STATE_SUFFIXES)), np.nan)
+    if entries:
+        rows, cols, values = zip(*entries)
+        state[rows, cols] = values
+    return state
 
 
 def _split_motor_key(key: str) -> tuple[str | None, str | None]:
-    if "." not in key:
-        return None, None
-    motor, suffix = key.rsplit(".", 1)
-    if suffix not in _STATE_SUFFIXES:
+    motor, sep, suffix = key.rpartition(".")
+    if not sep or suffix not in _SUFFIX_IDX:
         return None, None
     return motor, suffix
 
 
-def _merge_order(primary: list[str], secondary: list[str]) -> list[str]:
-    merged = list(primary)
-    for motor in secondary:
-        if motor not in merged:
-            merged.append(motor)
-    return merged
-
-
-def _build_cells(
-    motors: list[str],
-    columns: list[tuple[str, dict[str, dict[str, float]], str]],
-    precision: int,
-) -> list[list[str]]:
-    rows: list[list[str]] = []
-    for motor in motors:
-        row_values: list[str] = []
-        for _, state, suffix in columns:
-            value = state.get(motor, {}).get(suffix)
-            row_values.append(_format_value(value, precision))
-        rows.append(row_values)
-    return rows
-
-
-def _format_value(value: float | None, precision: int) -> str:
-    if value is None:
-        return "-"
-    return f"{value:.{precision}f}"
+def _format_column(values: np.ndarray, value_format: str) -> list[str]:
+    # printf-style with a prebuilt spec avoids parsing a nested f-string spec per cell.
+    return ["-" if value != value else value_format % value for value in values.tolist()]
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+import logging
 import math
 from pathlib import Path
 from typing import Iterable
 
 import numpy as np
+from numpy.typing import DTypeLike
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+_SAVE_POOL: ThreadPoolExecutor | None = None
+
+
+@dataclass(frozen=True, slots=True)
 class ScurveDurations:
     distance: float
     t_j: float
@@ -18,14 +26,60 @@ class ScurveDurations:
     T: float
     v_peak: float
     a_peak: float
+    # Phase boundaries and boundary states of the first half, derived once per profile so the
+    # evaluators only compute `tau = t - tk` and the phase polynomial.
+    t1: float = field(init=False, repr=False, compare=False)
+    t2: float = field(init=False, repr=False, compare=False)
+    t3: float = field(init=False, repr=False, compare=False)
+    t4: float = field(init=False, repr=False, compare=False)
+    v1: float = field(init=False, repr=False, compare=False)
+    q1: float = field(init=False, repr=False, compare=False)
+    a1: float = field(init=False, repr=False, compare=False)
+    v2: float = field(init=False, repr=False, compare=False)
+    q2: float = field(init=False, repr=False, compare=False)
+    q3: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        t_j, t_a, j = self.t_j, self.t_a, self.j
+        t2 = t_j + t_a
+        t3 = t2 + t_j
+        v1 = 0.5 * j * t_j**2
+        q1 = (1.0 / 6.0) * j * t_j**3
+        a1 = j * t_j
+        derived = {
+            "t1": t_j,
+            "t2": t2,
+            "t3": t3,
+            "t4": t3 + self.t_v,
+            "v1": v1,
+            "q1": q1,
+            "a1": a1,
+            "v2": v1 + a1 * t_a,
+            "q2": q1 + v1 * t_a + 0.5 * a1 * t_a**2,
+            "q3": j * t_j**3 + 1.5 * j * t_j**2 * t_a + 0.5 * j * t_j * t_a**2,
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
 
 
 def build_time_samples(T: float, dt: float) -> np.ndarray:
+    """Sample times `0, dt, 2*dt, ..., T`; the array is shared between calls and read-only."""
     if T <= 0.0 or dt <= 0.0:
         raise ValueError("T and dt must be positive.")
-    t = np.arange(0.0, T, dt, dtype=float)
-    if t.size == 0 or not math.isclose(t[-1], T):
-        t = np.append(t, T)
+    return _cached_time_samples(float(T), float(dt))
+
+
+@lru_cache(maxsize=32)
+def _cached_time_samples(T: float, dt: float) -> np.ndarray:
+    # Integer stride times dt: no accumulated step error, and the endpoint is written in place
+    # instead of appended. `n` samples fall below T, the last one is replaced by T if it is close.
+    n = math.ceil(T / dt)
+    if not math.isclose((n - 1) * dt, T):
+        n += 1
+    t = np.arange(n, dtype=float)
+    t *= dt
+    t[-1] = T
+    t.flags.writeable = False
     return t
 
 
@@ -98,58 +152,57 @@ def solve_scurve_durations(
     if search_steps < 2:
         return None
 
-    for step in range(search_steps):
-        frac = (search_steps - 1 - step) / (search_steps - 1)
-        t_j = t_j_max * frac
-        if t_j <= 0.0:
-            continue
-        candidate = _solve_ta(distance, T, j_lim, t_j)
-        if candidate is None:
-            continue
-        t_a, t_v = candidate
-        return build_params(t_j, t_a, t_v)
+    found = _search_t_j(distance, T, j_lim, t_j_max, search_steps)
+    if found is None:
+        return None
+    return build_params(*found)
 
-    return None
+
+def _search_t_j(
+    distance: float, T: float, j: float, t_j_max: float, search_steps: int
+) -> tuple[float, float, float] | None:
+    # `_solve_ta` over the whole grid t_j_max * (1 .. 0) at once; the largest feasible t_j wins.
+    frac = np.arange(search_steps - 1, -1, -1, dtype=float) / (search_steps - 1)
+    t_j = t_j_max * frac
+    t_j = t_j[t_j > 0.0]
+    K = distance / (j * t_j)
+    disc = (T - 3.0 * t_j) ** 2 + 4.0 * (t_j * T - 2.0 * t_j**2 - K)
+    sqrt_disc = np.sqrt(np.maximum(disc, 0.0))
+    t_a_hi = 0.5 * ((T - 3.0 * t_j) + sqrt_disc)
+    t_a_lo = 0.5 * ((T - 3.0 * t_j) - sqrt_disc)
+    t_v_hi = T - 4.0 * t_j - 2.0 * t_a_hi
+    t_v_lo = T - 4.0 * t_j - 2.0 * t_a_lo
+    ok_hi = (t_a_hi >= -1e-9) & (t_v_hi >= -1e-9)
+    ok_lo = (t_a_lo >= -1e-9) & (t_v_lo >= -1e-9)
+    ok = (disc >= -1e-12) & (ok_hi | ok_lo)
+    if not ok.any():
+        return None
+    i = int(np.argmax(ok))
+    if ok_hi[i]:
+        t_a, t_v = t_a_hi[i], t_v_hi[i]
+    else:
+        t_a, t_v = t_a_lo[i], t_v_lo[i]
+    return float(t_j[i]), max(float(t_a), 0.0), max(float(t_v), 0.0)
 
 
 def _state_first_half(t: float, params: ScurveDurations) -> tuple[float, float]:
-    t_j = params.t_j
-    t_a = params.t_a
-    t_v = params.t_v
+    # Phase polynomials in Horner form, matching the coefficient table of `_phase_tables`.
     j = params.j
-
-    t1 = t_j
-    t2 = t1 + t_a
-    t3 = t2 + t_j
-    t4 = t3 + t_v
-
-    v1 = 0.5 * j * t_j**2
-    q1 = (1.0 / 6.0) * j * t_j**3
-    a1 = j * t_j
-    v2 = v1 + a1 * t_a
-    q2 = q1 + v1 * t_a + 0.5 * a1 * t_a**2
-    v_peak = params.v_peak
-    q3 = j * t_j**3 + 1.5 * j * t_j**2 * t_a + 0.5 * j * t_j * t_a**2
-
-    if t <= t1:
-        q = (1.0 / 6.0) * j * t**3
-        v = 0.5 * j * t**2
-        return q, v
-    if t <= t2:
-        tau = t - t1
-        q = q1 + v1 * tau + 0.5 * a1 * tau**2
-        v = v1 + a1 * tau
-        return q, v
-    if t <= t3:
-        tau = t - t2
-        q = q2 + v2 * tau + 0.5 * a1 * tau**2 - (1.0 / 6.0) * j * tau**3
-        v = v2 + a1 * tau - 0.5 * j * tau**2
-        return q, v
-    if t <= t4:
-        tau = t - t3
-        q = q3 + v_peak * tau
-        v = v_peak
+    if t <= params.t1:
+        return (j / 6.0 * t) * t * t, (0.5 * j * t) * t
+    if t <= params.t2:
+        tau = t - params.t1
+        a1 = params.a1
+        return (0.5 * a1 * tau + params.v1) * tau + params.q1, a1 * tau + params.v1
+    if t <= params.t3:
+        tau = t - params.t2
+        a1 = params.a1
+        v2 = params.v2
+        q = ((-j / 6.0 * tau + 0.5 * a1) * tau + v2) * tau + params.q2
+        v = (-0.5 * j * tau + a1) * tau + v2
         return q, v
+    if t <= params.t4:
+        return params.v_peak * (t - params.t3) + params.q3, params.v_peak
     return params.distance, 0.0
 
 
@@ -159,13 +212,7 @@ def scurve_state_at(t: float, params: ScurveDurations) -> tuple[float, float]:
     if t >= params.T:
         return params.distance, 0.0
 
-    t_j = params.t_j
-    t_a = params.t_a
-    t_v = params.t_v
-    t3 = 2.0 * t_j + t_a
-    t4 = t3 + t_v
-
-    if t <= t4:
+    if t <= params.t4:
         return _state_first_half(t, params)
 
     t_mirror = params.T - t
@@ -182,6 +229,7 @@ def generate_scurve_profile(
     a_lim: float,
     *,
     t_samples: Iterable[float] | None = None,
+    dtype: DTypeLike = np.float64,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, ScurveDurations] | None:
     t_samples_arr = np.asarray(t_samples, dtype=float) if t_samples is not None else build_time_samples(T, dt)
     distance = float(abs(q1 - q0))
@@ -189,18 +237,117 @@ def generate_scurve_profile(
     if params is None:
         return None
     if distance == 0.0:
-        q = np.full_like(t_samples_arr, q0, dtype=float)
-        dq = np.zeros_like(t_samples_arr, dtype=float)
+        # Constant profile: read-only broadcast views, no per-sample storage.
+        q = np.broadcast_to(np.asarray(q0, dtype=dtype), t_samples_arr.shape)
+        dq = np.broadcast_to(np.zeros((), dtype=dtype), t_samples_arr.shape)
         return t_samples_arr, q, dq, params
 
     sign = 1.0 if q1 >= q0 else -1.0
-    q = np.empty_like(t_samples_arr)
-    dq = np.empty_like(t_samples_arr)
-    for idx, t in enumerate(t_samples_arr):
-        pos, vel = scurve_state_at(float(t), params)
-        q[idx] = q0 + sign * pos
-        dq[idx] = sign * vel
-    return t_samples_arr, q, dq, params
+    pos, vel = _scurve_state_vec(t_samples_arr.reshape(-1), [params])
+    q = pos[0].reshape(t_samples_arr.shape)
+    q *= sign
+    q += q0
+    dq = vel[0].reshape(t_samples_arr.shape)
+    dq *= sign
+    return t_samples_arr, q.astype(dtype, copy=False), dq.astype(dtype, copy=False), params
+
+
+def _phase_tables(params: list[ScurveDurations]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Per profile: first-half phase starts (n, 4) and cubic/quadratic coefficients in
+    # `tau = t - start`, highest degree first: position (n, 4, 4) and velocity (n, 4, 3).
+    n = len(params)
+    starts = np.zeros((n, 4))
+    cq = np.zeros((n, 4, 4))
+    cv = np.zeros((n, 4, 3))
+    misc = np.empty((n, 3))
+    for i, p in enumerate(params):
+        jq, jv, aq = p.j / 6.0, 0.5 * p.j, 0.5 * p.a1
+        starts[i] = (0.0, p.t1, p.t2, p.t3)
+        cq[i] = ((jq, 0.0, 0.0, 0.0), (0.0, aq, p.v1, p.q1), (-jq, aq, p.v2, p.q2), (0.0, 0.0, p.v_peak, p.q3))
+        cv[i] = ((jv, 0.0, 0.0), (0.0, p.a1, p.v1), (-jv, p.a1, p.v2), (0.0, 0.0, p.v_peak))
+        misc[i] = (p.distance, p.T, p.t4)
+    return starts, cq, cv, misc
+
+
+def _scurve_state_vec(t: np.ndarray, params: list[ScurveDurations]) -> tuple[np.ndarray, np.ndarray]:
+    """Evaluate `scurve_state_at` for every profile in `params` at every time in `t` -> (n, len(t))."""
+    starts, cq, cv, misc = _phase_tables(params)
+    distance, T, t4 = misc.T[:, :, None]
+    t = np.asarray(t, dtype=float)[None, :]
+
+    # The second half mirrors the first through T - t, so only four phases are tabulated.
+    first = t <= t4
+    u = np.where(first, t, T - t)
+    # Phase index = number of boundaries strictly below u (`searchsorted(..., side="left")`),
+    # computed per profile since every row has its own boundaries.
+    k = (u > starts[:, 1, None]).astype(np.intp)
+    k += u > starts[:, 2, None]
+    k += u > starts[:, 3, None]
+    rows = np.arange(len(params))[:, None]
+    tau = u - starts[rows, k]
+
+    # q and v share one contiguous buffer and are built in place (Horner, mirror, clamps).
+    q, v = np.empty((2, *tau.shape))
+    c = cq[rows, k]
+    np.multiply(c[..., 0], tau, out=q)
+    q += c[..., 1]
+    q *= tau
+    q += c[..., 2]
+    q *= tau
+    q += c[..., 3]
+    c = cv[rows, k]
+    np.multiply(c[..., 0], tau, out=v)
+    v += c[..., 1]
+    v *= tau
+    v += c[..., 2]
+
+    np.subtract(distance, q, out=q, where=~first)
+    np.copyto(q, np.broadcast_to(distance, q.shape), where=t >= T)
+    np.copyto(q, 0.0, where=t <= 0.0)
+    np.copyto(v, 0.0, where=(t <= 0.0) | (t >= T))
+    return q, v
+
+
+def generate_scurve_profile_batch(
+    q0: np.ndarray,
+    q1: np.ndarray,
+    T: float,
+    dt: float,
+    j_lim: np.ndarray,
+    a_lim: np.ndarray,
+    *,
+    t_samples: Iterable[float] | None = None,
+    dtype: DTypeLike = np.float64,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[ScurveDurations]] | None:
+    """
+    Multi-joint `generate_scurve_profile`: one segment of duration `T` for every joint at once.
+
+    Profiles are always evaluated in float64; `dtype` only sets the storage of the returned
+    `q`/`dq` (e.g. `np.float32` for streaming), while `t` stays float64.
+
+    Returns:
+        (t, q, dq, params) with `q`/`dq` of shape (n_dof, len(t)), or None if any joint is infeasible.
+    """
+    t_samples_arr = np.asarray(t_samples, dtype=float) if t_samples is not None else build_time_samples(T, dt)
+    q0 = np.asarray(q0, dtype=float)
+    q1 = np.asarray(q1, dtype=float)
+    distances = np.abs(q1 - q0).tolist()
+    j_lims = np.broadcast_to(j_lim, q0.shape).tolist()
+    a_lims = np.broadcast_to(a_lim, q0.shape).tolist()
+    params = []
+    for distance, j, a in zip(distances, j_lims, a_lims):
+        p = solve_scurve_durations(distance, T, j, a)
+        if p is None:
+            return None
+        params.append(p)
+
+    # The evaluator returns fresh (n_dof, N) arrays; sign and offset are applied in place.
+    q, dq = _scurve_state_vec(t_samples_arr, params)
+    sign = np.where(q1 >= q0, 1.0, -1.0)[:, None]
+    q *= sign
+    q += q0[:, None]
+    dq *= sign
+    return t_samples_arr, q.astype(dtype, copy=False), dq.astype(dtype, copy=False), params
 
 
 def run_scurve_self_test(
@@ -212,32 +359,52 @@ def run_scurve_self_test(
     a_lim: float = 120.0,
     j_lim: float = 300.0,
     save_path: str | Path | None = None,
+    save_async: bool = False,
 ) -> dict[str, float]:
     result = generate_scurve_profile(0.0, distance, T, dt, j_lim, a_lim)
     if result is None:
         raise AssertionError("Profile generation failed in self-test.")
     t, q, dq, params = result
 
-    if np.any(~np.isfinite(q)) or np.any(~np.isfinite(dq)):
+    if not (np.isfinite(q).all() and np.isfinite(dq).all()):
         raise AssertionError("Non-finite values in profile.")
 
-    max_v = float(np.max(np.abs(dq)))
+    # max/min pairs instead of reducing np.abs(...) temporaries.
+    max_v = float(max(dq.max(), -dq.min()))
     if max_v > v_lim + 1e-6:
         raise AssertionError(f"Velocity limit exceeded: {max_v} > {v_lim}")
 
-    dt_samples = np.diff(t)
-    dq_est = np.diff(q) / dt_samples
-    max_dq_err = float(np.max(np.abs(dq_est - dq[:-1])))
+    dq_err = np.diff(q)
+    dq_err /= np.diff(t)
+    dq_err -= dq[:-1]
+    max_dq_err = float(max(dq_err.max(), -dq_err.min()))
     if max_dq_err > max(1e-3, 0.1 * max_v):
         raise AssertionError(f"Discontinuity detected in dq (max error {max_dq_err}).")
 
     if save_path is not None:
         path = Path(save_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        np.savez(path, t=t, q=q, dq=dq)
+        if save_async:
+            # Written in the background; the file may not exist yet when this returns.
+            _save_pool().submit(np.savez, path, t=t, q=q, dq=dq).add_done_callback(_log_save_error)
+        else:
+            np.savez(path, t=t, q=q, dq=dq)
 
     return {
         "max_velocity": max_v,
         "a_peak": params.a_peak,
         "j_peak": params.j,
     }
+
+
+def _save_pool() -> ThreadPoolExecutor:
+    # Created on first use; pending writes are joined at interpreter exit by concurrent.futures.
+    global _SAVE_POOL
+    if _SAVE_POOL is None:
+        _SAVE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scurve-savez")
+    return _SAVE_POOL
+
+
+def _log_save_error(future: Future) -> None:
+    if future.exception() is not None:
+        logger.error("Failed to save S-curve self-test arrays: %s", future.exception())